@@ -10,6 +10,9 @@ Bits are appended MSB-first within each byte:
 - First bit appended goes to bit position 7
 - Second bit goes to position 6, etc.
 
+Pending bits are held in a small integer accumulator and moved to the
+byte array as soon as a whole byte is available.
+
 MicroPython compatible - no typing module imports.
 """
 
@@ -23,12 +26,28 @@ class BitBuffer:
 
     def __init__(self) -> None:
         """Initialize an empty bit buffer."""
-        self._data = bytearray()
+        self._data = bytearray()  # Completed bytes
+        self._acc = 0  # Pending bits, right-aligned
+        self._acc_bits = 0  # Number of pending bits (0-7)
         self.num_bits = 0
 
     def clear(self) -> None:
         """Clear the buffer."""
         self._data = bytearray()
+        self._acc = 0
+        self._acc_bits = 0
+        self.num_bits = 0
+
+    def reset(self) -> None:
+        """
+        Empty the buffer for reuse.
+
+        A fresh byte array is used rather than truncating the old one in
+        place, since MicroPython bytearrays don't support slice deletion.
+        """
+        self._data = bytearray()
+        self._acc = 0
+        self._acc_bits = 0
         self.num_bits = 0
 
     def append_bit(self, bit: int) -> None:
@@ -38,18 +57,35 @@ class BitBuffer:
         Args:
             bit: Bit value (0 or non-zero for 1)
         """
-        byte_index = self.num_bits // 8
-        bit_index = self.num_bits % 8
+        # CCSDS uses MSB-first bit ordering: shift in at the bottom
+        self._acc = (self._acc << 1) | (1 if bit else 0)
+        self._acc_bits += 1
+        self.num_bits += 1
 
-        # Extend buffer if needed
-        while byte_index >= len(self._data):
-            self._data.append(0)
+        if self._acc_bits == 8:
+            self._data.append(self._acc)
+            self._acc = 0
+            self._acc_bits = 0
 
-        # CCSDS uses MSB-first bit ordering: first bit goes to position 7
-        if bit:
-            self._data[byte_index] |= 1 << (7 - bit_index)
+    def append_value(self, value: int, num_bits: int) -> None:
+        """
+        Append the low num_bits of an integer, MSB first.
 
-        self.num_bits += 1
+        Args:
+            value: Integer whose low num_bits are appended
+            num_bits: Number of bits to append
+        """
+        acc = (self._acc << num_bits) | (value & ((1 << num_bits) - 1))
+        acc_bits = self._acc_bits + num_bits
+        self.num_bits += num_bits
+
+        # Flush every complete byte
+        while acc_bits >= 8:
+            acc_bits -= 8
+            self._data.append((acc >> acc_bits) & 0xFF)
+
+        self._acc = acc & ((1 << acc_bits) - 1)
+        self._acc_bits = acc_bits
 
     def append_bits(self, data: bytes, num_bits: int) -> None:
         """
@@ -59,13 +95,14 @@ class BitBuffer:
             data: Source bytes
             num_bits: Number of bits to append (MSB-first)
         """
-        for i in range(num_bits):
-            byte_index = i // 8
-            bit_index = i % 8
+        full_bytes = num_bits // 8
+        for i in range(full_bytes):
+            self.append_value(data[i], 8)
 
-            # Extract bits MSB-first (bit 7, 6, 5, ..., 0)
-            bit = (data[byte_index] >> (7 - bit_index)) & 1
-            self.append_bit(bit)
+        # Leading bits of the final partial byte
+        remainder = num_bits % 8
+        if remainder:
+            self.append_value(data[full_bytes] >> (8 - remainder), remainder)
 
     def append_bitvector(self, bv: "BitVector") -> None:
         """
@@ -74,26 +111,8 @@ class BitBuffer:
         Args:
             bv: BitVector to append
         """
-        # Calculate number of bytes from bit length
-        num_bytes = (bv.length + 7) // 8
-
         # CCSDS MSB-first: bytes in order, bits within each byte from MSB to LSB
-        for byte_idx in range(num_bytes):
-            bits_in_this_byte = 8
-
-            # Last byte may have fewer than 8 bits
-            if byte_idx == num_bytes - 1:
-                remainder = bv.length % 8
-                if remainder != 0:
-                    bits_in_this_byte = remainder
-
-            # With MSB-first bitvector indexing: bit 0 is MSB, bit 7 is LSB
-            # We want to append bits in order: MSB first, LSB last
-            start_bit = byte_idx * 8
-            for bit_offset in range(bits_in_this_byte):
-                pos = start_bit + bit_offset
-                bit = bv.get_bit(pos)
-                self.append_bit(bit)
+        self.append_bits(bv.to_bytes(), bv.length)
 
     def to_bytes(self) -> bytes:
         """
@@ -102,9 +121,10 @@ class BitBuffer:
         Returns:
             Bytes representation of the buffer
         """
-        if self.num_bits == 0:
-            return b""
+        data = self._data
+        if self._acc_bits == 0:
+            return bytes(data)
 
-        # Calculate number of bytes needed
-        num_bytes = (self.num_bits + 7) // 8
-        return bytes(self._data[:num_bytes])
+        # Left-align the pending bits in a final, zero-padded byte. _data is
+        # left untouched (MicroPython bytearrays can't delete items).
+        return bytes(data) + bytes(((self._acc << (8 - self._acc_bits)) & 0xFF,))
@@ -16,12 +16,12 @@ MicroPython compatible - no typing module imports.
 class BitReader:
     """Sequential bit reader from bytes."""
 
-    def __init__(self, data: bytes) -> None:
+    def __init__(self, data: "bytes | bytearray | memoryview") -> None:
         """
         Initialize a bit reader.
 
         Args:
-            data: Bytes to read from
+            data: Bytes-like object to read from (not copied)
         """
         self._data = data
         self._total_bits = len(data) * 8
@@ -84,10 +84,24 @@ class BitReader:
         if self.position + num_bits > self._total_bits:
             raise EOFError(f"Not enough bits: need {num_bits}, have {self.remaining}")
 
+        data = self._data
+        position = self.position
+        remaining = num_bits
         result = 0
-        for _ in range(num_bits):
-            result = (result << 1) | self.read_bit()
 
+        # Take up to a whole byte per step, MSB-first
+        while remaining:
+            bit_offset = position & 7
+            available = 8 - bit_offset
+            take = available if available < remaining else remaining
+
+            byte = data[position >> 3] & (0xFF >> bit_offset)
+            result = (result << take) | (byte >> (available - take))
+
+            position += take
+            remaining -= take
+
+        self.position = position
         return result
 
     def align_byte(self) -> None:
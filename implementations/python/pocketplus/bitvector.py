@@ -12,6 +12,14 @@ Bit Numbering Convention (CCSDS 124.0-B-1 Section 1.6.1):
 MicroPython compatible - no typing module imports.
 """
 
+import struct
+
+# Bit-reversed value of every byte (bit 0 <-> bit 7, ...), for turning
+# MSB-first runs into the LSB-first order used by bit extraction
+REVERSE_BYTE = bytes(
+    sum(((i >> bit) & 1) << (7 - bit) for bit in range(8)) for i in range(256)
+)
+
 
 class BitVector:
     """Fixed-length bit vector using 32-bit word storage."""
@@ -39,8 +47,7 @@ class BitVector:
 
     def zero(self) -> None:
         """Set all bits to zero."""
-        for i in range(self.num_words):
-            self._data[i] = 0
+        self._data[:] = [0] * self.num_words
 
     def copy(self) -> "BitVector":
         """
@@ -50,8 +57,7 @@ class BitVector:
             New BitVector with same contents
         """
         result = BitVector(self.length)
-        for i in range(self.num_words):
-            result._data[i] = self._data[i]
+        result._data[:] = self._data
         return result
 
     def copy_from(self, other: "BitVector") -> None:
@@ -62,8 +68,7 @@ class BitVector:
             other: Source bit vector to copy from
         """
         num_words = min(self.num_words, other.num_words)
-        for i in range(num_words):
-            self._data[i] = other._data[i]
+        self._data[:num_words] = other._data[:num_words]
 
     def get_bit(self, pos: int) -> int:
         """
@@ -128,35 +133,35 @@ class BitVector:
             # Clear bit to 0
             self._data[word_index] &= ~(1 << bit_in_word)
 
-    def from_bytes(self, data: bytes) -> None:
+    def from_bytes(self, data: "bytes | bytearray | memoryview") -> None:
         """
         Load bit vector from bytes.
 
         Args:
-            data: Bytes to load (big-endian)
+            data: Bytes to load (big-endian); any bytes-like object,
+                such as a memoryview slice, is accepted
         """
-        # Zero the array first
-        self.zero()
-
-        # Pack bytes into 32-bit words (big-endian)
-        j = 4  # Counter for bytes within word (4, 3, 2, 1)
-        bytes_to_int = 0
-        current_word = 0
-
-        for byte in data:
-            j -= 1
-            bytes_to_int |= byte << (j * 8)
-
-            if j == 0:
-                # Word complete - store it
-                self._data[current_word] = bytes_to_int
-                current_word += 1
-                bytes_to_int = 0
-                j = 4
-
-        # Handle incomplete final word
-        if j < 4:
-            self._data[current_word] = bytes_to_int
+        words = self._data
+        num_words = self.num_words
+        num_bytes = len(data)
+
+        # Unpack complete 32-bit words (big-endian) in one call
+        full_words = min(num_bytes // 4, num_words)
+        words[:full_words] = struct.unpack_from(f">{full_words}I", data)
+
+        next_word = full_words
+        if next_word < num_words:
+            # Handle incomplete final word, left-aligned like a full word
+            tail = data[full_words * 4 : full_words * 4 + 4]
+            if tail:
+                words[next_word] = int.from_bytes(
+                    bytes(tail) + bytes(4 - len(tail)), "big"
+                )
+                next_word += 1
+
+            # Zero any words not covered by data
+            for i in range(next_word, num_words):
+                words[i] = 0
 
     def to_bytes(self) -> bytes:
         """
@@ -166,20 +171,11 @@ class BitVector:
             Bytes representation (big-endian)
         """
         expected_bytes = (self.length + 7) // 8
-        result = bytearray(expected_bytes)
-
-        byte_index = 0
-        for word_index in range(self.num_words):
-            word = self._data[word_index]
+        packed = struct.pack(f">{self.num_words}I", *self._data)
 
-            # Extract up to 4 bytes from this word
-            for j in range(3, -1, -1):
-                if byte_index >= expected_bytes:
-                    break
-                result[byte_index] = (word >> (j * 8)) & 0xFF
-                byte_index += 1
-
-        return bytes(result)
+        if expected_bytes == len(packed):
+            return packed
+        return packed[:expected_bytes]
 
     def xor(self, a: "BitVector", b: "BitVector | None" = None) -> "BitVector":
         """
@@ -200,14 +196,14 @@ class BitVector:
             # Old API: return self XOR a
             result = BitVector(self.length)
             num_words = min(self.num_words, a.num_words)
-            for i in range(num_words):
-                result._data[i] = self._data[i] ^ a._data[i]
+            result._data[:num_words] = [x ^ y for x, y in zip(self._data, a._data)]
             return result
         else:
             # New API: self = a XOR b
             num_words = min(self.num_words, a.num_words, b.num_words)
-            for i in range(num_words):
-                self._data[i] = a._data[i] ^ b._data[i]
+            self._data[:num_words] = [
+                x ^ y for x, y in zip(a._data[:num_words], b._data)
+            ]
             return self
 
     def or_(self, a: "BitVector", b: "BitVector | None" = None) -> "BitVector":
@@ -229,14 +225,14 @@ class BitVector:
             # Old API: return self OR a
             result = BitVector(self.length)
             num_words = min(self.num_words, a.num_words)
-            for i in range(num_words):
-                result._data[i] = self._data[i] | a._data[i]
+            result._data[:num_words] = [x | y for x, y in zip(self._data, a._data)]
             return result
         else:
             # New API: self = a OR b
             num_words = min(self.num_words, a.num_words, b.num_words)
-            for i in range(num_words):
-                self._data[i] = a._data[i] | b._data[i]
+            self._data[:num_words] = [
+                x | y for x, y in zip(a._data[:num_words], b._data)
+            ]
             return self
 
     def and_(self, other: "BitVector") -> "BitVector":
@@ -251,61 +247,85 @@ class BitVector:
         """
         result = BitVector(self.length)
         num_words = min(self.num_words, other.num_words)
-
-        for i in range(num_words):
-            result._data[i] = self._data[i] & other._data[i]
-
+        result._data[:num_words] = [x & y for x, y in zip(self._data, other._data)]
         return result
 
-    def not_(self) -> "BitVector":
+    def not_(self, a: "BitVector | None" = None) -> "BitVector":
         """
         Compute NOT (bitwise inversion).
 
+        Two calling conventions:
+        - result = v.not_() - returns new vector with NOT v
+        - v.not_(a) - stores NOT a into v (in-place)
+
+        Args:
+            a: Operand (optional)
+
         Returns:
-            New BitVector with inverted bits
+            New BitVector if a is None, else self
         """
-        result = BitVector(self.length)
+        if a is None:
+            # Old API: return NOT self
+            result = BitVector(self.length)
+            source = self
+        else:
+            # New API: self = NOT a
+            result = self
+            source = a
 
-        for i in range(self.num_words):
-            result._data[i] = ~self._data[i] & 0xFFFFFFFF
+        num_words = min(result.num_words, source.num_words)
+        result._data[:num_words] = [~x & 0xFFFFFFFF for x in source._data[:num_words]]
 
         # Mask off unused bits in last word
-        if self.num_words > 0:
-            num_bytes = (self.length + 7) // 8
+        if result.num_words > 0:
+            num_bytes = (result.length + 7) // 8
             bytes_in_last_word = ((num_bytes - 1) % 4) + 1
-            bits_in_last_byte = self.length - ((num_bytes - 1) * 8)
+            bits_in_last_byte = result.length - ((num_bytes - 1) * 8)
 
             # Create mask for valid bits in big-endian word
             mask = 0
             for byte in range(bytes_in_last_word):
                 if byte == bytes_in_last_word - 1:
-                    byte_mask = (1 << bits_in_last_byte) - 1
+                    # Valid bits are the high (MSB-first) bits of the byte
+                    byte_mask = (0xFF << (8 - bits_in_last_byte)) & 0xFF
                 else:
                     byte_mask = 0xFF
                 shift_amt = (3 - byte) * 8
                 mask |= byte_mask << shift_amt
 
-            result._data[self.num_words - 1] &= mask
+            result._data[result.num_words - 1] &= mask
 
         return result
 
-    def left_shift(self) -> "BitVector":
+    def left_shift(self, a: "BitVector | None" = None) -> "BitVector":
         """
         Compute left shift by 1 position.
 
         Left shift moves bits toward MSB (lower indices).
         MSB is lost, LSB becomes 0.
 
+        Two calling conventions:
+        - result = v.left_shift() - returns new vector with v shifted
+        - v.left_shift(a) - stores a shifted into v (in-place)
+
+        Args:
+            a: Operand (optional)
+
         Returns:
-            New BitVector with shifted bits
+            New BitVector if a is None, else self
         """
-        result = BitVector(self.length)
+        if a is None:
+            result = BitVector(self.length)
+            source = self
+        else:
+            result = self
+            source = a
 
         # Word-level left shift (big-endian: MSB in high bits of first word)
         # Shift each word left by 1, carry MSB from next word
         carry = 0
-        for i in range(self.num_words - 1, -1, -1):
-            word = self._data[i]
+        for i in range(min(result.num_words, source.num_words) - 1, -1, -1):
+            word = source._data[i]
             result._data[i] = ((word << 1) | carry) & 0xFFFFFFFF
             carry = (word >> 31) & 1
 
@@ -320,11 +340,9 @@ class BitVector:
         """
         count = 0
         for word in self._data:
-            # Fast popcount using bit manipulation
-            n = word
-            while n:
-                count += n & 1
-                n >>= 1
+            # Popcount per word; zero words are common in sparse masks
+            if word:
+                count += bin(word).count("1")
         return count
 
     def equals(self, other: "BitVector") -> bool:
@@ -340,8 +358,4 @@ class BitVector:
         if self.length != other.length:
             return False
 
-        for i in range(self.num_words):
-            if self._data[i] != other._data[i]:
-                return False
-
-        return True
+        return self._data == other._data
@@ -9,6 +9,16 @@ Implements CCSDS 124.0-B-1 Section 5.3 (Encoding Step):
 MicroPython compatible - no typing module imports.
 """
 
+# Per-packet helpers, imported once rather than on every compress_packet call
+from pocketplus.bitbuffer import BitBuffer
+from pocketplus.encode import (
+    bit_extract,
+    bit_extract_forward,
+    count_encode,
+    rle_encode,
+)
+from pocketplus.mask import update_step
+
 # Import for type hints only
 if False:  # noqa: SIM108
     from pocketplus.bitvector import BitVector
@@ -84,6 +94,13 @@ class Compressor:
         self.prev_input = BitVector(packet_length)
         self.initial_mask = BitVector(packet_length)
 
+        # Per-packet work vectors, reused on every call to compress_packet
+        self.Xt = BitVector(packet_length)  # Robustness window
+        self.scratch = BitVector(packet_length)  # Inverted/extraction/HXOR mask
+
+        # Output buffer, reset and reused for every packet
+        self.output_buffer = BitBuffer()
+
         # Set initial mask if provided
         if initial_mask is not None:
             self.initial_mask.copy_from(initial_mask)
@@ -138,58 +155,30 @@ class Compressor:
         Returns:
             Compressed output bytes
         """
-        from pocketplus.bitbuffer import BitBuffer
-        from pocketplus.bitvector import BitVector
-        from pocketplus.encode import (
-            bit_extract,
-            bit_extract_forward,
-            count_encode,
-            rle_encode,
-        )
-        from pocketplus.mask import compute_change, update_build, update_mask
-
         # Use default params if none provided
         if params is None:
             params = CompressParams(min_robustness=self.robustness)
 
-        output = BitBuffer()
+        output = self.output_buffer
+        output.reset()
 
         # ================================================================
         # STEP 1: Update Mask and Build Vectors (CCSDS Section 4)
         # ================================================================
 
-        # Save previous mask
-        prev_mask = self.mask.copy()
-
-        # Save previous build
-        prev_build = self.build.copy()
-
-        # Update build vector (Equation 6)
-        if self.t > 0:
-            update_build(
-                self.build,
-                input_vec,
-                self.prev_input,
-                params.new_mask_flag,
-                self.t,
-            )
-
-        # Update mask vector (Equation 7)
-        if self.t > 0:
-            update_mask(
-                self.mask,
-                input_vec,
-                self.prev_input,
-                prev_build,
-                params.new_mask_flag,
-            )
-
-        # Compute change vector (Equation 8)
-        change = BitVector(self.F)
-        compute_change(change, self.mask, prev_mask, self.t)
-
-        # Store change in history (circular buffer)
-        self.change_history[self.history_index].copy_from(change)
+        # Update build, mask and change vectors (Equations 6-8). The change
+        # vector is written straight into its history slot (circular
+        # buffer), so no per-packet vector is allocated or copied.
+        change = self.change_history[self.history_index]
+        update_step(
+            self.build,
+            self.mask,
+            change,
+            input_vec,
+            self.prev_input,
+            params.new_mask_flag,
+            self.t,
+        )
 
         # ================================================================
         # STEP 2: Encode Output Packet (CCSDS Section 5.3)
@@ -226,10 +215,7 @@ class Compressor:
             if et:
                 # kt - Output '1' for positive updates (mask=0), '0' for negative
                 # Extract INVERTED mask values in forward order
-                inverted_mask = BitVector(self.F)
-                for j in range(self.mask.length):
-                    mask_bit = self.mask.get_bit(j)
-                    inverted_mask.set_bit(j, 1 if mask_bit == 0 else 0)
+                inverted_mask = self.scratch.not_(self.mask)
 
                 bit_extract_forward(output, inverted_mask, Xt)
 
@@ -250,8 +236,8 @@ class Compressor:
                 output.append_bit(1)  # Flag: mask follows
 
                 # Encode mask as RLE(M XOR (M<<))
-                mask_shifted = self.mask.left_shift()
-                mask_diff = self.mask.xor(mask_shifted)
+                mask_diff = self.scratch.left_shift(self.mask)
+                mask_diff.xor(self.mask, mask_diff)
                 rle_encode(output, mask_diff)
             else:
                 output.append_bit(0)  # Flag: no mask
@@ -275,7 +261,7 @@ class Compressor:
 
             if ct and Vt > 0:
                 # BE(It, (Xt OR Mt)) - extract bits where mask OR changes are set
-                extraction_mask = self.mask.or_(Xt)
+                extraction_mask = self.scratch.or_(self.mask, Xt)
                 bit_extract(output, input_vec, extraction_mask)
             else:
                 # BE(It, Mt) - extract only unpredictable bits
@@ -318,18 +304,16 @@ def compute_robustness_window(
         current_change: Current change vector Dt
 
     Returns:
-        Robustness window Xt
+        Robustness window Xt (the compressor's reused Xt vector)
     """
-    from pocketplus.bitvector import BitVector
+    Xt = comp.Xt
 
-    Xt = BitVector(comp.F)
+    # Xt = Dt (no reversal - RLE processes LSB to MSB directly)
+    Xt.copy_from(current_change)
 
-    if comp.robustness == 0 or comp.t == 0:
-        # Xt = Dt (no reversal - RLE processes LSB to MSB directly)
-        Xt.copy_from(current_change)
-    else:
+    if comp.robustness > 0 and comp.t > 0:
         # OR together changes from t-Rt to t
-        combined = current_change.copy()
+        x = Xt._data
 
         # Determine how many historical changes to include
         num_changes = min(comp.t, comp.robustness)
@@ -338,10 +322,9 @@ def compute_robustness_window(
         for i in range(1, num_changes + 1):
             # Calculate index of change from i iterations ago
             hist_idx = (comp.history_index + MAX_HISTORY - i) % MAX_HISTORY
-            combined = combined.or_(comp.change_history[hist_idx])
-
-        # Don't reverse - RLE will process from LSB to MSB directly
-        Xt.copy_from(combined)
+            h = comp.change_history[hist_idx]._data
+            for j in range(Xt.num_words):
+                x[j] |= h[j]
 
     return Xt
 
@@ -442,7 +425,7 @@ def compute_ct_flag(comp: Compressor, Vt: int, current_new_mask_flag: bool) -> i
 
 
 def compress(
-    data: bytes,
+    data: "bytes | bytearray | memoryview",
     packet_size: int,
     robustness: int = 1,
     pt_limit: int = 10,
@@ -498,18 +481,22 @@ def compress(
     # Output accumulation
     output_bytes = bytearray()
 
+    # Per-call constants: the input vector and parameters are reused for
+    # every packet (compress_packet copies what it keeps)
+    input_vec = BitVector(packet_size)
+    params = CompressParams(min_robustness=robustness)
+    auto_params = pt_limit > 0 and ft_limit > 0 and rt_limit > 0
+
+    # Slice packets out of a single view instead of copying each one
+    view = memoryview(data)
+
     # Process each packet
     for i in range(num_packets):
         # Load packet data
-        input_vec = BitVector(packet_size)
-        packet_data = data[i * packet_bytes : (i + 1) * packet_bytes]
-        input_vec.from_bytes(packet_data)
-
-        # Compute parameters
-        params = CompressParams(min_robustness=robustness)
+        input_vec.from_bytes(view[i * packet_bytes : (i + 1) * packet_bytes])
 
         # Automatic parameter management
-        if pt_limit > 0 and ft_limit > 0 and rt_limit > 0:
+        if auto_params:
             if i == 0:
                 # First packet: fixed init values
                 params.send_mask_flag = True
@@ -144,18 +144,26 @@ def bit_insert(reader: "BitReader", data: "BitVector", mask: "BitVector") -> Non
         data: BitVector to insert bits into
         mask: BitVector indicating which positions to fill
     """
-    # Collect positions of '1' bits in mask
-    positions = []
-    for i in range(mask.length):
-        if mask.get_bit(i):
-            positions.append(i)
+    data_words = data._data
+    mask_words = mask._data
+
+    # Insert bits in reverse order (highest position to lowest), visiting
+    # only set mask bits. This matches the extraction order in bit_extract
+    for word_idx in range(mask.num_words - 1, -1, -1):
+        mask_word = mask_words[word_idx]
+        if mask_word == 0:
+            continue
+        data_word = data_words[word_idx]
+
+        while mask_word:
+            lsb = mask_word & -mask_word
+            if reader.read_bit():
+                data_word |= lsb
+            else:
+                data_word &= ~lsb
+            mask_word ^= lsb
 
-    # Insert bits in reverse order (highest position to lowest)
-    # This matches the extraction order in bit_extract
-    for i in range(len(positions) - 1, -1, -1):
-        pos = positions[i]
-        bit = reader.read_bit()
-        data.set_bit(pos, bit)
+        data_words[word_idx] = data_word
 
 
 def bit_insert_forward(
@@ -171,8 +179,26 @@ def bit_insert_forward(
         data: BitVector to insert bits into
         mask: BitVector indicating which positions to fill
     """
-    # Insert bits in forward order
-    for i in range(mask.length):
-        if mask.get_bit(i):
-            bit = reader.read_bit()
-            data.set_bit(i, bit)
+    data_words = data._data
+    mask_words = mask._data
+
+    for word_idx in range(mask.num_words):
+        mask_word = mask_words[word_idx]
+        if mask_word == 0:
+            continue
+        data_word = data_words[word_idx]
+
+        # Set bits are found LSB first; fill them MSB first
+        lsbs = []
+        while mask_word:
+            lsb = mask_word & -mask_word
+            lsbs.append(lsb)
+            mask_word ^= lsb
+
+        for i in range(len(lsbs) - 1, -1, -1):
+            if reader.read_bit():
+                data_word |= lsbs[i]
+            else:
+                data_word &= ~lsbs[i]
+
+        data_words[word_idx] = data_word
@@ -9,9 +9,9 @@ Implements CCSDS 124.0-B-1 decompression (inverse of Section 5.3):
 MicroPython compatible - no typing module imports.
 """
 
-# Import for type hints only
-if False:  # noqa: SIM108
-    from pocketplus.bitvector import BitVector
+# Per-packet helpers, imported once rather than on every decompress_packet call
+from pocketplus.bitvector import BitVector
+from pocketplus.decode import bit_insert, count_decode, rle_decode
 
 # Constants
 MAX_ROBUSTNESS = 7
@@ -34,8 +34,6 @@ class Decompressor:
             robustness: Rt - Base robustness level (0-7)
             initial_mask: M0 - Initial mask vector (None = all zeros)
         """
-        from pocketplus.bitvector import BitVector
-
         self.F = packet_length
         self.robustness = min(robustness, MAX_ROBUSTNESS)
 
@@ -44,12 +42,17 @@ class Decompressor:
         self.initial_mask = BitVector(packet_length)
         self.prev_output = BitVector(packet_length)
         self.Xt = BitVector(packet_length)  # Positive changes tracker
+        self.scratch = BitVector(packet_length)  # Extraction mask
 
         # Set initial mask if provided
         if initial_mask is not None:
             self.initial_mask.copy_from(initial_mask)
             self.mask.copy_from(initial_mask)
 
+        # Word layout of F: valid bits in the last 32-bit word, used to
+        # read uncompressed packets a word at a time
+        self.last_word_bits = packet_length - (self.mask.num_words - 1) * 32
+
         # Time index
         self.t = 0
 
@@ -70,9 +73,6 @@ class Decompressor:
         Returns:
             Decompressed output packet (length F)
         """
-        from pocketplus.bitvector import BitVector
-        from pocketplus.decode import bit_insert, count_decode, rle_decode
-
         output = BitVector(self.F)
 
         # Copy previous output as prediction base
@@ -102,42 +102,41 @@ class Decompressor:
 
             if et == 1:
                 # Read kt - determines positive/negative updates
-                # kt has one bit per change in Xt
-                kt_bits = []
-
-                # Read kt bits (forward order)
-                for i in range(self.F):
-                    if Xt.get_bit(i):
-                        bit_val = reader.read_bit()
-                        kt_bits.append(bit_val)
-
-                # Apply mask updates based on kt
-                kt_idx = 0
-                for i in range(self.F):
-                    if Xt.get_bit(i):
-                        # kt=1 means positive update (mask becomes 0)
-                        # kt=0 means negative update (mask becomes 1)
-                        if kt_bits[kt_idx]:
-                            self.mask.set_bit(i, 0)
-                            self.Xt.set_bit(i, 1)  # Track positive change
+                # kt has one bit per change in Xt, in forward order
+                # kt=1 means positive update (mask becomes 0)
+                # kt=0 means negative update (mask becomes 1)
+                mask_words = self.mask._data
+                pos_words = self.Xt._data
+                change_words = Xt._data
+
+                for word_idx in range(Xt.num_words):
+                    change_word = change_words[word_idx]
+                    if change_word == 0:
+                        continue
+
+                    # Set bits are found LSB first; apply them MSB first
+                    lsbs = []
+                    while change_word:
+                        lsb = change_word & -change_word
+                        lsbs.append(lsb)
+                        change_word ^= lsb
+
+                    for i in range(len(lsbs) - 1, -1, -1):
+                        if reader.read_bit():
+                            mask_words[word_idx] &= ~lsbs[i]
+                            pos_words[word_idx] |= lsbs[i]  # Track positive change
                         else:
-                            self.mask.set_bit(i, 1)
-                        kt_idx += 1
+                            mask_words[word_idx] |= lsbs[i]
 
                 # Read ct
                 ct = reader.read_bit()
             else:
                 # et = 0: all updates are negative (mask bits become 1)
-                for i in range(self.F):
-                    if Xt.get_bit(i):
-                        self.mask.set_bit(i, 1)
+                self.mask.or_(self.mask, Xt)
 
         elif Vt == 0 and change_count > 0:
             # Vt = 0: toggle mask bits at change positions
-            for i in range(self.F):
-                if Xt.get_bit(i):
-                    current_val = self.mask.get_bit(i)
-                    self.mask.set_bit(i, 1 if current_val == 0 else 0)
+            self.mask.xor(self.mask, Xt)
 
         # Read dt
         dt = reader.read_bit()
@@ -160,20 +159,25 @@ class Decompressor:
 
                 # Reverse the horizontal XOR to get the actual mask.
                 # HXOR encoding: HXOR[i] = M[i] XOR M[i+1], with HXOR[F-1] = M[F-1]
-                # Reversal: start from LSB (position F-1) and work towards MSB
-                # M[F-1] = HXOR[F-1] (just copy)
-                # M[i] = HXOR[i] XOR M[i+1] for i < F-1
-
-                # Copy LSB bit directly (position F-1)
-                current = mask_diff.get_bit(self.F - 1)
-                self.mask.set_bit(self.F - 1, current)
-
-                # Process remaining bits from F-2 down to 0
-                for i in range(self.F - 2, -1, -1):
-                    hxor_bit = mask_diff.get_bit(i)
-                    # M[i] = HXOR[i] XOR M[i+1] = HXOR[i] XOR current
-                    current = hxor_bit ^ current
-                    self.mask.set_bit(i, current)
+                # so M[i] = HXOR[i] XOR HXOR[i+1] XOR ... XOR HXOR[F-1].
+                # Within a word that is a prefix XOR from the LSB upwards;
+                # the parity of all later words carries in from the next word.
+                hxor_words = mask_diff._data
+                mask_words = self.mask._data
+                carry = 0
+
+                for word_idx in range(mask_diff.num_words - 1, -1, -1):
+                    m = hxor_words[word_idx]
+                    m ^= m << 1
+                    m ^= m << 2
+                    m ^= m << 4
+                    m ^= m << 8
+                    m ^= m << 16
+                    m &= 0xFFFFFFFF
+                    if carry:
+                        m ^= 0xFFFFFFFF
+                    mask_words[word_idx] = m
+                    carry = m >> 31
 
             # Read rt flag
             rt = reader.read_bit()
@@ -182,18 +186,21 @@ class Decompressor:
             # Full packet follows: COUNT(F) || It
             _ = count_decode(reader)  # Read and discard packet length
 
-            # Read full packet
-            for i in range(self.F):
-                bit = reader.read_bit()
-                output.set_bit(i, bit)
+            # Read full packet a word at a time
+            out_words = output._data
+            last_word = output.num_words - 1
+            for word_idx in range(last_word):
+                out_words[word_idx] = reader.read_bits(32)
+            tail = self.last_word_bits
+            out_words[last_word] = reader.read_bits(tail) << (32 - tail)
         else:
             # Compressed: extract unpredictable bits
             if ct == 1 and Vt > 0:
                 # BE(It, (Xt OR Mt))
-                extraction_mask = self.mask.or_(self.Xt)
+                extraction_mask = self.scratch.or_(self.mask, self.Xt)
             else:
-                # BE(It, Mt)
-                extraction_mask = self.mask.copy()
+                # BE(It, Mt) - bit_insert only reads the mask
+                extraction_mask = self.mask
 
             # Insert unpredictable bits
             bit_insert(reader, output, extraction_mask)
@@ -214,7 +221,7 @@ if False:  # noqa: SIM108
 
 
 def decompress(
-    data: bytes,
+    data: "bytes | bytearray | memoryview",
     packet_size: int,
     robustness: int = 1,
     initial_mask: "BitVector | None" = None,
@@ -251,12 +258,19 @@ def decompress(
     # Output accumulation
     output_bytes = bytearray()
 
+    # Packets are decoded strictly in sequence: where one packet ends
+    # depends on the mask state left by the previous one, so the stream
+    # cannot be split up ahead of decoding.
+    decompress_packet = decomp.decompress_packet
+    append_output = output_bytes.extend
+    total_bits = len(data) * 8
+
     # Decompress packets until input exhausted
-    while reader.remaining > 0:
-        output = decomp.decompress_packet(reader)
+    while reader.position < total_bits:
+        output = decompress_packet(reader)
 
         # Append to output
-        output_bytes.extend(output.to_bytes())
+        append_output(output.to_bytes())
 
         # Align to byte boundary for next packet
         reader.align_byte()
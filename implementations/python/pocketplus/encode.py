@@ -9,13 +9,54 @@ Implements CCSDS 124.0-B-1 Section 5.2 encoding schemes:
 MicroPython compatible - no typing module imports.
 """
 
-import math
+from pocketplus.bitvector import REVERSE_BYTE
 
 # Import for type hints only
 if False:  # noqa: SIM108
     from pocketplus.bitbuffer import BitBuffer
     from pocketplus.bitvector import BitVector
 
+# Pre-computed COUNT codewords (pattern, bit length) for A = 1..33, indexed
+# by A: '0' for A = 1 and '110' || BIT5(A-2) for 2 <= A <= 33
+_COUNT_CODES = [(0, 0), (0, 1)] + [((0b110 << 5) | (a - 2), 8) for a in range(2, 34)]
+
+# DeBruijn lookup for fast LSB finding, converted to the bit position within
+# the word counted from the MSB (bit 0 = MSB)
+_DEBRUIJN_POSITION = [
+    31,
+    30,
+    3,
+    29,
+    2,
+    17,
+    7,
+    28,
+    1,
+    9,
+    11,
+    16,
+    6,
+    14,
+    27,
+    23,
+    0,
+    4,
+    18,
+    8,
+    10,
+    12,
+    15,
+    24,
+    5,
+    19,
+    13,
+    25,
+    20,
+    26,
+    21,
+    22,
+]
+
 
 def count_encode(output: "BitBuffer", a: int) -> None:
     """
@@ -36,35 +77,27 @@ def count_encode(output: "BitBuffer", a: int) -> None:
     if a < 1 or a > 65535:
         raise ValueError(f"COUNT value {a} out of range [1, 65535]")
 
-    if a == 1:
-        # Case 1: A = 1 → '0'
-        output.append_bit(0)
-
-    elif a <= 33:
-        # Case 2: 2 ≤ A ≤ 33 → '110' + BIT5(A-2)
-        output.append_bit(1)
-        output.append_bit(1)
-        output.append_bit(0)
-
-        # Append 5-bit value of (A-2), MSB first
-        value = a - 2
-        for i in range(4, -1, -1):
-            output.append_bit((value >> i) & 1)
+    if a <= 33:
+        # Cases 1 and 2: table lookup
+        pattern, num_bits = _COUNT_CODES[a]
+        output.append_value(pattern, num_bits)
 
     else:
         # Case 3: A ≥ 34 → '111' + BIT_E(A-2)
-        output.append_bit(1)
-        output.append_bit(1)
-        output.append_bit(1)
+        output.append_value(0b111, 3)
 
-        # Calculate E = 2*floor(log2(A-2)+1) - 6
+        # Calculate E = 2*floor(log2(A-2)+1) - 6 with integer shifts
+        # (A-2 < 2^16, so at most 16 steps; no float round-trip)
         value = a - 2
-        log_val = math.log2(value)
-        e = 2 * (int(math.floor(log_val)) + 1) - 6
+        floor_log = 0
+        v = value >> 1
+        while v:
+            floor_log += 1
+            v >>= 1
+        e = 2 * (floor_log + 1) - 6
 
         # Append E-bit value, MSB first
-        for i in range(e - 1, -1, -1):
-            output.append_bit((value >> i) & 1)
+        output.append_value(value, e)
 
 
 def rle_encode(output: "BitBuffer", bv: "BitVector") -> None:
@@ -80,69 +113,35 @@ def rle_encode(output: "BitBuffer", bv: "BitVector") -> None:
         output: BitBuffer to append encoded bits to
         bv: BitVector to encode
     """
-    # DeBruijn lookup table for fast LSB finding
-    debruijn_lookup = [
-        1,
-        2,
-        29,
-        3,
-        30,
-        15,
-        25,
-        4,
-        31,
-        23,
-        21,
-        16,
-        26,
-        18,
-        5,
-        9,
-        32,
-        28,
-        14,
-        24,
-        22,
-        20,
-        17,
-        8,
-        27,
-        13,
-        19,
-        7,
-        12,
-        6,
-        11,
-        10,
-    ]
+    count_codes = _COUNT_CODES
+    debruijn_position = _DEBRUIJN_POSITION
+    append_value = output.append_value
+    words = bv._data
 
     # Start from the end of the vector
     old_bit_position = bv.length
 
     # Process words in reverse order (from high to low)
     for word_idx in range(bv.num_words - 1, -1, -1):
-        word_data = bv._data[word_idx]
+        word_data = words[word_idx]
+        word_base = word_idx * 32
 
         # Process all set bits in this word
         while word_data != 0:
             # Isolate the LSB: x = word & -word
             lsb = word_data & (-word_data & 0xFFFFFFFF)
 
-            # Find LSB position using DeBruijn sequence
-            debruijn_index = ((lsb * 0x077CB531) & 0xFFFFFFFF) >> 27
-            bit_position_in_word = debruijn_lookup[debruijn_index]
-
-            # Count from the other side
-            bit_position_in_word = 32 - bit_position_in_word
-
-            # Calculate global bit position
-            new_bit_position = (word_idx * 32) + bit_position_in_word
+            # Global bit position via the DeBruijn sequence
+            new_bit_position = (
+                word_base + debruijn_position[((lsb * 0x077CB531) & 0xFFFFFFFF) >> 27]
+            )
 
-            # Calculate delta (number of zeros + 1)
+            # Calculate delta (number of zeros + 1) and encode the count
             delta = old_bit_position - new_bit_position
-
-            # Encode the count
-            count_encode(output, delta)
+            if delta <= 33:
+                append_value(*count_codes[delta])
+            else:
+                count_encode(output, delta)
 
             # Update old position for next iteration
             old_bit_position = new_bit_position
@@ -151,8 +150,7 @@ def rle_encode(output: "BitBuffer", bv: "BitVector") -> None:
             word_data ^= lsb
 
     # Append terminator '10'
-    output.append_bit(1)
-    output.append_bit(0)
+    append_value(0b10, 2)
 
 
 def bit_extract(output: "BitBuffer", data: "BitVector", mask: "BitVector") -> None:
@@ -177,17 +175,46 @@ def bit_extract(output: "BitBuffer", data: "BitVector", mask: "BitVector") -> No
     if data.length != mask.length:
         raise ValueError("Data and mask must have same length")
 
-    # Collect positions of '1' bits in mask
-    positions = []
-    for i in range(mask.length):
-        if mask.get_bit(i):
-            positions.append(i)
-
-    # Extract bits in reverse order (highest position to lowest)
-    for i in range(len(positions) - 1, -1, -1):
-        pos = positions[i]
-        bit = data.get_bit(pos)
-        output.append_bit(bit)
+    data_words = data._data
+    mask_words = mask._data
+    rev = REVERSE_BYTE
+
+    # Visit only the set mask bits, highest position first: words from last
+    # to first, and within a word from its LSB upwards
+    for word_idx in range(mask.num_words - 1, -1, -1):
+        mask_word = mask_words[word_idx]
+        if mask_word == 0:
+            continue
+        data_word = data_words[word_idx]
+
+        if mask_word == 0xFFFFFFFF:
+            # Full word: the extracted bits are the word bit-reversed
+            output.append_value(
+                (rev[data_word & 0xFF] << 24)
+                | (rev[(data_word >> 8) & 0xFF] << 16)
+                | (rev[(data_word >> 16) & 0xFF] << 8)
+                | rev[data_word >> 24],
+                32,
+            )
+            continue
+
+        # Partial word: bytes from the LSB upwards, whole bytes via the
+        # table and the rest bit by bit
+        for shift in (0, 8, 16, 24):
+            mask_byte = (mask_word >> shift) & 0xFF
+            if mask_byte == 0:
+                continue
+            data_byte = (data_word >> shift) & 0xFF
+
+            if mask_byte == 0xFF:
+                output.append_value(rev[data_byte], 8)
+                continue
+
+            while mask_byte:
+                # Isolate the LSB and emit the data bit under it
+                lsb = mask_byte & -mask_byte
+                output.append_bit(1 if data_byte & lsb else 0)
+                mask_byte ^= lsb
 
 
 def bit_extract_forward(
@@ -209,8 +236,21 @@ def bit_extract_forward(
     if data.length != mask.length:
         raise ValueError("Data and mask must have same length")
 
-    # Collect positions of '1' bits in mask and extract in forward order
-    for i in range(mask.length):
-        if mask.get_bit(i):
-            bit = data.get_bit(i)
-            output.append_bit(bit)
+    data_words = data._data
+    mask_words = mask._data
+
+    for word_idx in range(mask.num_words):
+        mask_word = mask_words[word_idx]
+        if mask_word == 0:
+            continue
+        data_word = data_words[word_idx]
+
+        # Set bits come out LSB first; emit them reversed (MSB first)
+        bits = []
+        while mask_word:
+            lsb = mask_word & -mask_word
+            bits.append(1 if data_word & lsb else 0)
+            mask_word ^= lsb
+
+        for i in range(len(bits) - 1, -1, -1):
+            output.append_bit(bits[i])
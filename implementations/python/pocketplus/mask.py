@@ -5,6 +5,7 @@ Implements CCSDS 124.0-B-1 Section 4 (Mask Update):
 - Build Vector Update (Equation 6)
 - Mask Vector Update (Equation 7)
 - Change Vector Computation (Equation 8)
+- Fused single-pass update of all three (update_step)
 
 MicroPython compatible - no typing module imports.
 """
@@ -43,13 +44,12 @@ def update_build(
         # Reset build to zero
         build.zero()
     else:
-        # Bt = (It XOR It-1) OR Bt-1
-        # Create temporary for changes
-        changes = input_vec.copy()
-        changes.xor(changes, prev_input)
-
-        # Update build: build = changes OR build
-        build.or_(build, changes)
+        # Bt = (It XOR It-1) OR Bt-1, word by word without temporaries
+        b = build._data
+        inp = input_vec._data
+        prev = prev_input._data
+        for i in range(build.num_words):
+            b[i] |= inp[i] ^ prev[i]
 
 
 def update_mask(
@@ -76,16 +76,19 @@ def update_mask(
         build_prev: Previous build vector Bt-1
         new_mask_flag: Whether a new mask is being established
     """
-    # Calculate changes: It XOR It-1
-    changes = input_vec.copy()
-    changes.xor(changes, prev_input)
+    m = mask._data
+    inp = input_vec._data
+    prev = prev_input._data
 
     if new_mask_flag:
-        # Mt = changes OR Bt-1
-        mask.or_(changes, build_prev)
+        # Mt = (It XOR It-1) OR Bt-1
+        bp = build_prev._data
+        for i in range(mask.num_words):
+            m[i] = (inp[i] ^ prev[i]) | bp[i]
     else:
-        # Mt = changes OR Mt-1
-        mask.or_(mask, changes)
+        # Mt = (It XOR It-1) OR Mt-1
+        for i in range(mask.num_words):
+            m[i] |= inp[i] ^ prev[i]
 
 
 def compute_change(
@@ -110,9 +113,68 @@ def compute_change(
         prev_mask: Previous mask vector Mt-1
         t: Current time step
     """
+    # Dt = Mt XOR (Mt-1 AND sel): sel selects Mt-1 for t > 0 and zero at
+    # t = 0 (assuming M-1 = 0), so both cases share one word loop
+    sel = 0 if t == 0 else 0xFFFFFFFF
+
+    d = change._data
+    m = mask._data
+    p = prev_mask._data
+    for i in range(min(change.num_words, mask.num_words, prev_mask.num_words)):
+        d[i] = m[i] ^ (p[i] & sel)
+
+
+def update_step(
+    build: "BitVector",
+    mask: "BitVector",
+    change: "BitVector",
+    input_vec: "BitVector",
+    prev_input: "BitVector",
+    new_mask_flag: bool,
+    t: int,
+) -> None:
+    """
+    Apply Equations 6, 7 and 8 for one time step in a single pass.
+
+    Equivalent to saving Bt-1 and Mt-1, then calling update_build,
+    update_mask and compute_change in turn (the first two only for t > 0),
+    but visits each word once and needs no copies of the previous
+    build and mask.
+
+    Args:
+        build: Build vector Bt-1, updated in place to Bt
+        mask: Mask vector Mt-1, updated in place to Mt
+        change: Change vector Dt (overwritten)
+        input_vec: Current input vector It
+        prev_input: Previous input vector It-1
+        new_mask_flag: Whether a new mask is being established
+        t: Current time step
+    """
     if t == 0:
-        # At t=0, D0 = M0 (assuming M-1 = 0)
+        # Build and mask are left untouched; D0 = M0
         change.copy_from(mask)
+        return
+
+    b = build._data
+    m = mask._data
+    d = change._data
+    inp = input_vec._data
+    prev = prev_input._data
+
+    if new_mask_flag:
+        # Mt = (It XOR It-1) OR Bt-1, then Bt = 0
+        for i in range(mask.num_words):
+            old = m[i]
+            new = (inp[i] ^ prev[i]) | b[i]
+            m[i] = new
+            d[i] = new ^ old
+            b[i] = 0
     else:
-        # Dt = Mt XOR Mt-1
-        change.xor(mask, prev_mask)
+        # Bt = (It XOR It-1) OR Bt-1, Mt = (It XOR It-1) OR Mt-1
+        for i in range(mask.num_words):
+            delta = inp[i] ^ prev[i]
+            old = m[i]
+            new = old | delta
+            b[i] |= delta
+            m[i] = new
+            d[i] = new ^ old
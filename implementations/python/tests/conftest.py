@@ -16,6 +16,10 @@ def pytest_addoption(parser):
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "slow: marks tests as slow")
+    # Registered here too so the marker is known when pytest-xdist is absent
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of a group in one xdist worker"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
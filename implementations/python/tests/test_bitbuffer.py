@@ -53,6 +53,44 @@ class TestBitBufferAppendBit:
         assert bb.to_bytes() == bytes([0b10000001])
 
 
+class TestBitBufferAppendValue:
+    """Test append_value method."""
+
+    def test_append_value_msb_first(self) -> None:
+        """Test that the value's low bits are appended MSB-first."""
+        bb = BitBuffer()
+        bb.append_value(0b110, 3)
+        bb.append_value(0b00101, 5)
+
+        assert bb.num_bits == 8
+        assert bb.to_bytes() == bytes([0b11000101])
+
+    def test_append_value_ignores_high_bits(self) -> None:
+        """Test that bits above num_bits are not appended."""
+        bb = BitBuffer()
+        bb.append_value(0xFF0F, 4)
+
+        assert bb.num_bits == 4
+        assert bb.to_bytes() == bytes([0b11110000])
+
+    def test_append_value_zero_bits(self) -> None:
+        """Test that appending zero bits is a no-op."""
+        bb = BitBuffer()
+        bb.append_value(0x1, 0)
+
+        assert bb.num_bits == 0
+        assert bb.to_bytes() == b""
+
+    def test_append_value_across_bytes(self) -> None:
+        """Test appending a value that spans byte boundaries."""
+        bb = BitBuffer()
+        bb.append_bit(1)
+        bb.append_value(0xDEAD, 16)
+
+        assert bb.num_bits == 17
+        assert bb.to_bytes() == bytes([0xEF, 0x56, 0x80])
+
+
 class TestBitBufferAppendBits:
     """Test append_bits method."""
 
@@ -157,6 +195,18 @@ class TestBitBufferToBytes:
         # First 4 bits are 1111, remaining should be 0
         assert result == bytes([0b11110000])
 
+    def test_to_bytes_leaves_buffer_intact(self) -> None:
+        """Test to_bytes can be called repeatedly and appending continues."""
+        bb = BitBuffer()
+        bb.append_bits(bytes([0xAB, 0xC0]), 12)
+
+        assert bb.to_bytes() == bytes([0xAB, 0xC0])
+        assert bb.to_bytes() == bytes([0xAB, 0xC0])
+
+        bb.append_bit(1)
+        assert bb.num_bits == 13
+        assert bb.to_bytes() == bytes([0xAB, 0xC8])
+
     def test_to_bytes_empty(self) -> None:
         """Test converting empty buffer."""
         bb = BitBuffer()
@@ -176,6 +226,18 @@ class TestBitBufferClear:
         assert bb.num_bits == 0
         assert bb.to_bytes() == b""
 
+    def test_reset(self) -> None:
+        """Test reset empties the buffer and it can be refilled."""
+        bb = BitBuffer()
+        bb.append_bits(bytes([0xFF, 0xF0]), 12)
+
+        bb.reset()
+        assert bb.num_bits == 0
+        assert bb.to_bytes() == b""
+
+        bb.append_bit(1)
+        assert bb.to_bytes() == bytes([0x80])
+
 
 class TestBitBufferSize:
     """Test size property."""
@@ -124,6 +124,14 @@ class TestBitVectorFromBytes:
         result = bv.to_bytes()
         assert result == original
 
+    def test_round_trip_partial_word_memoryview(self) -> None:
+        """Test round trip of a memoryview spanning a partial final word."""
+        original = bytes([0x01, 0x23, 0x45, 0x67, 0x89, 0xAB])
+        bv = BitVector(48)
+        bv.set_bit(47, 1)  # Stale bit must be overwritten
+        bv.from_bytes(memoryview(original))
+        assert bv.to_bytes() == original
+
 
 class TestBitVectorBitwiseOps:
     """Test bitwise operations (XOR, OR, AND, NOT)."""
@@ -209,6 +217,24 @@ class TestBitVectorBitwiseOps:
         for i in range(20):
             assert result.get_bit(i) == 0
 
+    def test_not_partial_byte_keeps_msb_bits(self) -> None:
+        """Test NOT sets the valid (high) bits of a partial last byte."""
+        a = BitVector(12)
+        a.from_bytes(bytes([0xA5, 0x50]))
+
+        result = a.not_()
+        assert result.to_bytes() == bytes([0x5A, 0xA0])
+
+    def test_not_in_place(self) -> None:
+        """Test NOT stored into an existing vector."""
+        a = BitVector(12)
+        a.from_bytes(bytes([0xA5, 0x50]))
+        out = BitVector(12)
+
+        result = out.not_(a)
+        assert result is out
+        assert out.to_bytes() == bytes([0x5A, 0xA0])
+
 
 class TestBitVectorLeftShift:
     """Test left shift operation."""
@@ -233,6 +259,16 @@ class TestBitVectorLeftShift:
         # 10000001 -> 00000010
         assert result.to_bytes() == bytes([0b00000010])
 
+    def test_left_shift_in_place_carries_across_words(self) -> None:
+        """Test left shift stored into an existing vector across words."""
+        a = BitVector(40)
+        a.from_bytes(bytes([0x00, 0x00, 0x00, 0x00, 0x80]))
+        out = BitVector(40)
+
+        result = out.left_shift(a)
+        assert result is out
+        assert out.to_bytes() == bytes([0x00, 0x00, 0x00, 0x01, 0x00])
+
 
 class TestBitVectorHammingWeight:
     """Test hamming weight (popcount)."""
@@ -172,6 +172,37 @@ class TestBitExtract:
         # Reversed: 00101101
         assert bb.to_bytes() == bytes([0b00101101])
 
+    def test_bit_extract_full_words(self) -> None:
+        """Test extraction of full 32-bit mask words next to a partial one."""
+        data = BitVector(72)
+        data.from_bytes(bytes([0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC, 0xDE, 0xF0, 0x81]))
+        mask = BitVector(72)
+        mask.from_bytes(bytes([0xFF] * 8 + [0xF0]))
+
+        bb = BitBuffer()
+        bit_extract(bb, data, mask)
+        assert bb.num_bits == 68
+        # Bits 0..67 of the data, emitted highest position first
+        bits = "".join(f"{b:08b}" for b in data.to_bytes())[:68][::-1]
+        expected = int(bits, 2) << 4
+        assert bb.to_bytes() == expected.to_bytes(9, "big")
+
+    def test_bit_extract_full_bytes_in_partial_word(self) -> None:
+        """Test extraction mixing fully masked and partly masked bytes."""
+        data = BitVector(32)
+        data.from_bytes(bytes([0xC3, 0x5A, 0x0F, 0x81]))
+        mask = BitVector(32)
+        mask.from_bytes(bytes([0xFF, 0x00, 0x81, 0xFF]))
+
+        bb = BitBuffer()
+        bit_extract(bb, data, mask)
+        assert bb.num_bits == 18
+        # Masked positions 0-7, 16, 23, 24-31, emitted highest first
+        bits = "".join(f"{b:08b}" for b in data.to_bytes())
+        positions = list(range(8)) + [16, 23] + list(range(24, 32))
+        expected = int("".join(bits[p] for p in reversed(positions)), 2) << 6
+        assert bb.to_bytes() == expected.to_bytes(3, "big")
+
     def test_bit_extract_partial_mask(self) -> None:
         """Test extraction with partial mask."""
         data = BitVector(8)
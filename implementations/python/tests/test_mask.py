@@ -1,7 +1,7 @@
 """Tests for mask operations (build, mask, change vectors)."""
 
 from pocketplus.bitvector import BitVector
-from pocketplus.mask import compute_change, update_build, update_mask
+from pocketplus.mask import compute_change, update_build, update_mask, update_step
 
 
 class TestUpdateBuild:
@@ -248,3 +248,60 @@ class TestMaskIntegration:
 
         # mask = (0x55 XOR 0x00) OR 0xFF = 0x55 OR 0xFF = 0xFF
         assert mask.to_bytes() == bytes([0xFF])
+
+
+class TestUpdateStep:
+    """Test the fused build/mask/change update."""
+
+    def _reference(
+        self,
+        build: BitVector,
+        mask: BitVector,
+        input_vec: BitVector,
+        prev_input: BitVector,
+        new_mask_flag: bool,
+        t: int,
+    ) -> BitVector:
+        """Run the three separate steps the way the compressor used to."""
+        prev_mask = mask.copy()
+        prev_build = build.copy()
+        if t > 0:
+            update_build(build, input_vec, prev_input, new_mask_flag, t)
+            update_mask(mask, input_vec, prev_input, prev_build, new_mask_flag)
+        change = BitVector(mask.length)
+        compute_change(change, mask, prev_mask, t)
+        return change
+
+    def test_update_step_matches_separate_steps(self) -> None:
+        """Test update_step against update_build/update_mask/compute_change."""
+        length = 40
+        inputs = [
+            bytes([0x00, 0x00, 0x00, 0x00, 0x00]),
+            bytes([0xF0, 0x00, 0x01, 0x00, 0x80]),
+            bytes([0xF0, 0x0F, 0x01, 0x00, 0x80]),
+            bytes([0x00, 0x0F, 0x01, 0xAA, 0x00]),
+            bytes([0x00, 0x0F, 0x01, 0xAA, 0x00]),
+        ]
+        flags = [False, False, True, False, True]
+
+        build_a, mask_a = BitVector(length), BitVector(length)
+        build_b, mask_b = BitVector(length), BitVector(length)
+        mask_a.from_bytes(bytes([0x01, 0x00, 0x00, 0x00, 0x00]))
+        mask_b.from_bytes(bytes([0x01, 0x00, 0x00, 0x00, 0x00]))
+        prev_input = BitVector(length)
+        change = BitVector(length)
+
+        for t, input_bytes in enumerate(inputs):
+            input_vec = BitVector(length)
+            input_vec.from_bytes(input_bytes)
+
+            expected = self._reference(
+                build_a, mask_a, input_vec, prev_input, flags[t], t
+            )
+            update_step(build_b, mask_b, change, input_vec, prev_input, flags[t], t)
+
+            assert build_b.to_bytes() == build_a.to_bytes()
+            assert mask_b.to_bytes() == mask_a.to_bytes()
+            assert change.to_bytes() == expected.to_bytes()
+
+            prev_input = input_vec
@@ -8,9 +8,16 @@ Run all tests:
 
 Skip slow tests (venus-express, housekeeping):
     pytest tests/test_vectors.py -m "not slow"
+
+Run vectors in parallel (pytest-xdist); loadgroup keeps all tests of a
+vector on one worker so its files are loaded only once:
+    pytest tests/test_vectors.py -n auto --dist loadgroup
 """
 
+import functools
 import json
+import mmap
+from collections import namedtuple
 from pathlib import Path
 
 import pytest
@@ -22,20 +29,34 @@ REPO_ROOT = Path(__file__).parent.parent.parent.parent
 TEST_VECTORS_DIR = REPO_ROOT / "test-vectors"
 INPUT_DIR = TEST_VECTORS_DIR / "input"
 EXPECTED_DIR = TEST_VECTORS_DIR / "expected-output"
+MANIFEST_FILE = TEST_VECTORS_DIR / "manifest.json"
 
 # Large vectors that take significant time to process
 SLOW_VECTORS = {"venus-express", "housekeeping"}
 
+# compress() arguments for a vector, in signature order
+# (packet_size is in bits, the metadata's packet_length is in bytes)
+Params = namedtuple("Params", "packet_size robustness pt_limit ft_limit rt_limit")
+
 
+@functools.cache
 def load_metadata(name: str) -> dict:
-    """Load metadata JSON for a test vector."""
+    """Load metadata JSON for a test vector (parsed once per name)."""
     metadata_path = EXPECTED_DIR / f"{name}-metadata.json"
     with open(metadata_path) as f:
         return json.load(f)
 
 
 def get_test_vectors() -> list:
-    """Get list of available test vectors with their parameters."""
+    """Get list of available test vectors with their parameters.
+
+    Reads test-vectors/manifest.json (written by
+    test-vector-generator/scripts/write_manifest.py) when present, and
+    otherwise scans the metadata files.
+    """
+    if MANIFEST_FILE.exists():
+        return json.loads(MANIFEST_FILE.read_text())
+
     vectors = []
 
     # Map metadata input filenames to actual filenames (some were renamed)
@@ -79,61 +100,90 @@ TEST_VECTORS = get_test_vectors()
 
 
 def get_parametrized_vectors():
-    """Get test vectors with slow markers applied."""
+    """Get test vectors with slow markers applied, smallest first.
+
+    Ordering by compressed size makes `pytest -x` hit failures on the quick
+    vectors before spending time on the large ones.
+    """
     params = []
-    for v in TEST_VECTORS:
+    for v in sorted(TEST_VECTORS, key=lambda v: v["expected_size"]):
+        marks = [pytest.mark.xdist_group(name=v["name"])]
         if v["name"] in SLOW_VECTORS:
-            params.append(pytest.param(v, marks=pytest.mark.slow, id=v["name"]))
-        else:
-            params.append(pytest.param(v, id=v["name"]))
+            marks.append(pytest.mark.slow)
+        params.append(pytest.param(v, marks=marks, id=v["name"]))
     return params
 
 
 PARAMETRIZED_VECTORS = get_parametrized_vectors()
 
 
-@pytest.fixture
+def map_file(path: Path) -> mmap.mmap:
+    """Memory-map a file read-only."""
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@pytest.fixture(scope="session")
 def vector_data(request):
-    """Load input and expected output for a test vector."""
-    vector = request.param
+    """Load input and expected output for a test vector.
 
-    input_path = INPUT_DIR / vector["input_file"]
-    expected_path = EXPECTED_DIR / vector["output_file"]
+    Session-scoped, so each vector's files are mapped once and shared by
+    every test class that uses it. The files are memory-mapped and handed
+    out as memoryviews, so no full-size copy is made; compress() and
+    decompress() accept any bytes-like input.
+    """
+    vector = request.param
 
-    with open(input_path, "rb") as f:
-        input_data = f.read()
+    # Manifest entries are not stat'ed up front; skip if the input is gone
+    if not (INPUT_DIR / vector["input_file"]).exists():
+        pytest.skip(f"input file {vector['input_file']} not found")
 
-    with open(expected_path, "rb") as f:
-        expected_output = f.read()
+    input_map = map_file(INPUT_DIR / vector["input_file"])
+    expected_map = map_file(EXPECTED_DIR / vector["output_file"])
+    input_data = memoryview(input_map)
+    expected_output = memoryview(expected_map)
 
-    return {
+    yield {
         **vector,
+        "params": Params(
+            vector["packet_length"] * 8,
+            vector["robustness"],
+            vector["pt"],
+            vector["ft"],
+            vector["rt"],
+        ),
         "input_data": input_data,
         "expected_output": expected_output,
     }
 
+    input_data.release()
+    expected_output.release()
+    input_map.close()
+    expected_map.close()
+
+
+@pytest.fixture(scope="session")
+def compressed_output(vector_data: dict) -> bytes:
+    """Compress a test vector's input once per session.
+
+    Shared by the compression and round-trip tests, which would otherwise
+    both compress the same input with the same parameters.
+    """
+    return compress(vector_data["input_data"], *vector_data["params"])
+
 
 class TestVectorCompression:
     """Test compression output matches reference."""
 
     @pytest.mark.parametrize("vector_data", PARAMETRIZED_VECTORS, indirect=True)
-    def test_compression_matches_reference(self, vector_data: dict) -> None:
+    def test_compression_matches_reference(
+        self, vector_data: dict, compressed_output: bytes
+    ) -> None:
         """Test that compression produces byte-identical output."""
-        input_data = vector_data["input_data"]
         expected_output = vector_data["expected_output"]
 
-        # Compress using Python implementation
-        # packet_length is in bytes, packet_size is in bits
-        packet_size_bits = vector_data["packet_length"] * 8
-
-        actual_output = compress(
-            input_data,
-            packet_size=packet_size_bits,
-            robustness=vector_data["robustness"],
-            pt_limit=vector_data["pt"],
-            ft_limit=vector_data["ft"],
-            rt_limit=vector_data["rt"],
-        )
+        # Compressed by the Python implementation (shared fixture)
+        actual_output = compressed_output
 
         # Compare byte-for-byte
         assert actual_output == expected_output, (
@@ -146,26 +196,16 @@ class TestVectorRoundTrip:
     """Test round-trip decompression."""
 
     @pytest.mark.parametrize("vector_data", PARAMETRIZED_VECTORS, indirect=True)
-    def test_round_trip(self, vector_data: dict) -> None:
+    def test_round_trip(self, vector_data: dict, compressed_output: bytes) -> None:
         """Test that compress then decompress returns original."""
         input_data = vector_data["input_data"]
-        packet_size_bits = vector_data["packet_length"] * 8
-
-        # Compress
-        compressed = compress(
-            input_data,
-            packet_size=packet_size_bits,
-            robustness=vector_data["robustness"],
-            pt_limit=vector_data["pt"],
-            ft_limit=vector_data["ft"],
-            rt_limit=vector_data["rt"],
-        )
+        params = vector_data["params"]
 
-        # Decompress
+        # Decompress the (shared) compressed output
         decompressed = decompress(
-            compressed,
-            packet_size=packet_size_bits,
-            robustness=vector_data["robustness"],
+            compressed_output,
+            packet_size=params.packet_size,
+            robustness=params.robustness,
         )
 
         assert decompressed == input_data, (
@@ -182,13 +222,13 @@ class TestVectorDecompressReference:
         """Test that decompressing reference output produces original input."""
         input_data = vector_data["input_data"]
         expected_output = vector_data["expected_output"]
-        packet_size_bits = vector_data["packet_length"] * 8
+        params = vector_data["params"]
 
         # Decompress the reference compressed output
         decompressed = decompress(
             expected_output,
-            packet_size=packet_size_bits,
-            robustness=vector_data["robustness"],
+            packet_size=params.packet_size,
+            robustness=params.robustness,
         )
 
         assert decompressed == input_data, (
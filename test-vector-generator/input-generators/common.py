@@ -2,10 +2,13 @@
 Common utilities for test vector generation.
 Provides shared functions for creating deterministic binary data.
 """
+import binascii
 import struct
 import hashlib
+import mmap
+import traceback
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
 
 def set_deterministic_seed(seed: int):
@@ -27,57 +30,109 @@ def write_bytes(packet: bytearray, positions: Tuple[int, int], data: bytes):
     packet[start:end+1] = data
 
 
+# Precompiled packers for the common field widths, keyed by
+# (num_bytes, byteorder, signed)
+_VALUE_STRUCTS = {
+    (size, byteorder, signed): struct.Struct(
+        ('>' if byteorder == 'big' else '<') + (code.lower() if signed else code))
+    for size, code in ((1, 'B'), (2, 'H'), (4, 'I'), (8, 'Q'))
+    for byteorder in ('big', 'little')
+    for signed in (False, True)
+}
+
+
 def write_value(packet: bytearray, positions: Tuple[int, int], value: int, byteorder='big', signed=False):
     """Write an integer value to packet at specified positions."""
     start, end = positions
     num_bytes = end - start + 1
-    data = value.to_bytes(num_bytes, byteorder=byteorder, signed=signed)
-    packet[start:end+1] = data
+    packer = _VALUE_STRUCTS.get((num_bytes, byteorder, signed))
+    if packer is None:
+        # Odd widths (3, 5, 6, 7 bytes, ...)
+        packet[start:end+1] = value.to_bytes(num_bytes, byteorder=byteorder, signed=signed)
+        return
+    try:
+        packer.pack_into(packet, start, value)
+    except struct.error as e:
+        # Match int.to_bytes for out-of-range values
+        raise OverflowError(str(e)) from None
+
+
+def write_value_column(rows: np.ndarray, positions: Tuple[int, int], values: np.ndarray):
+    """Write one big-endian unsigned integer per row of a packet array.
+
+    ``rows`` is a (num_packets, packet_length) uint8 view of the dataset and
+    ``values`` holds one value per packet; the field is 1, 2, 4 or 8 bytes.
+    The field's columns are viewed as a big-endian integer per row, so the
+    values are byte-swapped straight into ``rows`` with no packed copy.
+    Negative values are stored in two's complement.
+    """
+    start, end = positions
+    num_bytes = end - start + 1
+    rows[:, start:end+1].view(f'>u{num_bytes}')[:, 0] = values
 
 
 def write_repeating_sequence(packet: bytearray, positions: Tuple[int, int], sequence: List[int]):
     """Write a repeating sequence to packet."""
     start, end = positions
     length = end - start + 1
-    repeated = (sequence * (length // len(sequence) + 1))[:length]
-    packet[start:end+1] = bytes(repeated)
-
-
-def write_random_bytes(packet: bytearray, positions: Tuple[int, int], seed: int = None):
-    """Write random bytes to packet."""
-    if seed is not None:
-        np.random.seed(seed)
+    # Repeat at the bytes level (a C memcpy loop), not as a list of ints
+    pattern = bytes(sequence)
+    repeats = -(-length // len(pattern))
+    packet[start:end+1] = (pattern * repeats)[:length]
+
+
+def write_random_bytes(packet: bytearray, positions: Tuple[int, int], seed: int = None,
+                       rng: Optional[np.random.Generator] = None):
+    """Write random bytes to packet.
+
+    Bytes come from ``rng`` if given, else from a fresh PCG64 generator
+    seeded with ``seed`` (cheap to create, unlike reseeding MT19937). One
+    of the two is required, so the output is always deterministic.
+    """
+    if rng is None:
+        if seed is None:
+            raise ValueError("write_random_bytes needs a seed or an rng")
+        rng = np.random.default_rng(seed)
     start, end = positions
     length = end - start + 1
-    random_data = np.random.randint(0, 256, length, dtype=np.uint8)
-    packet[start:end+1] = bytes(random_data)
+    packet[start:end+1] = rng.bytes(length)
+
+
+_BE_F32 = struct.Struct('>f')  # Big-endian float
 
 
 def write_float32(packet: bytearray, position: int, value: float):
     """Write a 32-bit float at specified position (4 bytes)."""
-    data = struct.pack('>f', value)  # Big-endian float
-    packet[position:position+4] = data
+    _BE_F32.pack_into(packet, position, value)
 
 
 def calculate_crc16_ccitt(data: bytes) -> int:
-    """Calculate CRC-16-CCITT checksum."""
-    crc = 0xFFFF
-    for byte in data:
-        crc ^= byte << 8
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ 0x1021
-            else:
-                crc = crc << 1
-            crc &= 0xFFFF
-    return crc
+    """Calculate CRC-16-CCITT checksum.
+
+    binascii.crc_hqx implements the same polynomial (0x1021, MSB-first) in C;
+    starting it from 0xFFFF gives the CCITT variant used here.
+    """
+    return binascii.crc_hqx(data, 0xFFFF)
 
 
-def calculate_md5(data: bytes) -> str:
-    """Calculate MD5 hash of data."""
+def calculate_md5(data: Union[bytes, bytearray, memoryview]) -> str:
+    """Calculate MD5 hash of data.
+
+    Accepts any bytes-like object; hashlib reads the buffer in place, so
+    bytearrays and memoryview slices are hashed without copying.
+    """
     return hashlib.md5(data).hexdigest()
 
 
+def calculate_sha256(data: Union[bytes, bytearray, memoryview]) -> str:
+    """Calculate SHA-256 hash of data.
+
+    Faster than MD5 where OpenSSL uses the SHA extensions, so it is used
+    to fingerprint the large vectors written by generate.py.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
 def increment_counter(value: int, increment: int, num_bytes: int) -> int:
     """Increment counter with wraparound based on byte size."""
     max_value = (1 << (num_bytes * 8)) - 1
@@ -91,28 +146,96 @@ class PacketGenerator:
         self.packet_length = packet_length
         self.num_packets = num_packets
         self.seed = seed
-        set_deterministic_seed(seed)
 
-    def generate_packet(self, packet_num: int) -> bytearray:
-        """Generate a single packet. Override in subclasses."""
+    def fill_template(self, packet: memoryview):
+        """Write the fields that are identical in every packet (optional).
+
+        ``packet`` is zero-initialised. The template is built once and
+        copied into every packet slot before fill_packet runs.
+        """
+
+    def fill_packet(self, packet_num: int, packet: memoryview):
+        """Write packet ``packet_num`` into ``packet``. Override in subclasses.
+
+        ``packet`` is a packet_length-byte slot of the dataset buffer that
+        already holds the template; write the remaining fields in place with
+        the helpers above.
+        """
         raise NotImplementedError
 
-    def generate_all(self) -> bytes:
-        """Generate all packets and return as bytes."""
-        all_data = bytearray()
+    def build_template(self) -> bytearray:
+        """Build the template packet written by fill_template."""
+        template = create_empty_packet(self.packet_length)
+        self.fill_template(memoryview(template))
+        return template
+
+    def generate_packet(self, packet_num: int) -> bytearray:
+        """Generate a single packet as a standalone bytearray."""
+        packet = self.build_template()
+        self.fill_packet(packet_num, memoryview(packet))
+        return packet
+
+    def fill_all(self, rows: np.ndarray):
+        """Write every packet into ``rows``, a (num_packets, packet_length) array.
+
+        ``rows`` is a uint8 view of the dataset buffer with the template
+        already in every row. The default finishes each packet in place with
+        fill_packet; subclasses override this to fill whole columns (one
+        field across all packets) with array stores instead.
+        """
+        length = self.packet_length
+        view = memoryview(rows).cast('B')
+        offset = 0
         for i in range(self.num_packets):
-            packet = self.generate_packet(i)
-            all_data.extend(packet)
-        return bytes(all_data)
+            self.fill_packet(i, view[offset:offset + length])
+            offset += length
+        view.release()
+
+    def generate_all(self) -> bytearray:
+        """Generate all packets and return the dataset buffer.
+
+        The buffer itself is returned rather than a bytes copy of it, so
+        peak memory stays at one dataset.
+        """
+        # Lay the template down in every slot in one go; fill_all then
+        # finishes the packets in place, so no per-packet buffer is
+        # allocated or copied
+        all_data = self.build_template() * self.num_packets
+        rows = np.frombuffer(all_data, dtype=np.uint8).reshape(self.num_packets, self.packet_length)
+        self.fill_all(rows)
+        del rows
+        return all_data
 
     def save_to_file(self, filename: str):
-        """Generate and save all packets to file."""
-        data = self.generate_all()
-        with open(filename, 'wb') as f:
-            f.write(data)
-
-        # Calculate and print MD5
-        md5_hash = calculate_md5(data)
-        print(f"Generated {self.num_packets} packets ({len(data)} bytes)")
+        """Generate and save all packets to file.
+
+        The output file is sized up front and memory-mapped, and the
+        packets are filled straight into the mapping, so no in-memory copy
+        of the dataset is built and no write() calls are made.
+        """
+        size = self.num_packets * self.packet_length
+        with open(filename, 'w+b') as f:
+            f.truncate(size)
+            if size == 0:
+                md5_hash = calculate_md5(b'')
+            else:
+                with mmap.mmap(f.fileno(), size) as mm:
+                    rows = np.frombuffer(mm, dtype=np.uint8).reshape(self.num_packets, self.packet_length)
+                    try:
+                        rows[:] = np.frombuffer(self.build_template(), dtype=np.uint8)
+                        self.fill_all(rows)
+                    except BaseException as exc:
+                        # The failed frames still hold views of the mapping;
+                        # clear them so it can close and this error surfaces
+                        traceback.clear_frames(exc.__traceback__)
+                        raise
+                    finally:
+                        # Drop the array's export of the mapping so it can close
+                        del rows
+
+                    # Calculate MD5 over the mapped file (hashed in place)
+                    md5_hash = calculate_md5(mm)
+
+        print(f"Generated {self.num_packets} packets ({size} bytes)")
         print(f"MD5: {md5_hash}")
         return md5_hash
@@ -32,17 +32,21 @@ Examples:
 """
 
 import argparse
+import functools
 import json
+import mmap
+import os
 import struct
 import subprocess
 import sys
 import hashlib
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Iterator, List, Dict, Tuple, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict, field
 from enum import IntEnum
-from common import set_deterministic_seed, calculate_md5
+from common import calculate_sha256
 
 
 # Packet type markers
@@ -62,10 +66,21 @@ class MalformedType(IntEnum):
     RANDOM = 5
 
 
+# Byte values cycled through by the "edge" input pattern
+EDGE_PATTERNS = np.array([0x00, 0xFF, 0xAA, 0x55, 0x0F, 0xF0], dtype=np.uint8)
+
 # File format
 MAGIC = b'PKT+'
 VERSION = 1
 
+# File header: magic, version, R, packet length, packet count
+_HDR = struct.Struct('>4sBBHI')
+# Record header: stored length, packet type, malformed subtype
+_REC = struct.Struct('>HBB')
+
+# Faulted streams are written in chunks of this many bytes
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class PacketInfo:
@@ -87,11 +102,11 @@ class TestVectorInfo:
     seed: int
 
     input_file: str
-    input_md5: str
+    input_sha256: str
     input_size: int
 
     compressed_file: str
-    compressed_md5: str
+    compressed_sha256: str
     compressed_size: int
 
     # Only present if faults injected
@@ -112,141 +127,245 @@ class TestVectorInfo:
     packets: List[Dict] = field(default_factory=list)
 
 
-def generate_input_data(pattern: str, num_packets: int, packet_length: int, seed: int) -> bytes:
-    """Generate input data based on pattern type."""
-    np.random.seed(seed)
-    data = bytearray()
-
+def clipped_walk(start: float, steps: np.ndarray, lo: float, hi: float,
+                 window: int = 1024) -> np.ndarray:
+    """Random walk from start, clipped to [lo, hi] after every step.
+
+    Equivalent to ``x = clip(x + step, lo, hi)`` per step, but runs as a
+    cumulative sum and only restarts at the steps that leave the range.
+    """
+    n = len(steps)
+    out = np.empty(n)
+    pos = 0
+    x = start
+    while pos < n:
+        end = min(n, pos + window)
+        # Summing from x itself keeps the float rounding of sequential adds
+        path = np.cumsum(np.concatenate(([x], steps[pos:end])))[1:]
+        outside = np.flatnonzero((path < lo) | (path > hi))
+        if not outside.size:
+            out[pos:end] = path
+            x = path[-1]
+            pos = end
+            continue
+        k = outside[0]
+        out[pos:pos + k] = path[:k]
+        x = min(max(path[k], lo), hi)
+        out[pos + k] = x
+        pos += k + 1
+    return out
+
+
+def write_be_column(block: np.ndarray, pos: int, values: np.ndarray, dtype: str):
+    """Write one big-endian field per row of block, starting at column pos.
+
+    The field's columns are viewed as one big-endian integer per row, so
+    the values are byte-swapped straight into the block without building
+    a packed temporary.
+    """
+    width = np.dtype(dtype).itemsize
+    block[:, pos:pos + width].view(dtype)[:, 0] = values
+
+
+# Packets per block yielded by generate_input_chunks
+INPUT_CHUNK_PACKETS = 4096
+
+
+def generate_input_chunks(pattern: str, num_packets: int, packet_length: int, seed: int,
+                          chunk_packets: int = INPUT_CHUNK_PACKETS) -> Iterator[np.ndarray]:
+    """Generate input data based on pattern type, a block of packets at a time.
+
+    Yields (n, packet_length) uint8 arrays, one row per packet, with
+    n <= chunk_packets, so the whole stream never has to be held in memory.
+    """
     if pattern == "housekeeping":
-        temps = np.random.uniform(20.0, 30.0, 4)
-        volts = np.random.uniform(3.2, 3.4, 4)
-
-        for pkt_num in range(num_packets):
-            packet = bytearray(packet_length)
+        rng = np.random.default_rng(seed)
+        temps = rng.uniform(20.0, 30.0, 4)
+        volts = rng.uniform(3.2, 3.4, 4)
+
+        for first in range(0, num_packets, chunk_packets):
+            n = min(chunk_packets, num_packets - first)
+            temp_steps = rng.uniform(-0.1, 0.1, (n, 4))
+            volt_steps = rng.uniform(-0.01, 0.01, (n, 4))
+
+            # One row per packet; each field is filled for the block at once
+            block = np.zeros((n, packet_length), dtype=np.uint8)
+            pkt_nums = np.arange(first, first + n, dtype=np.int64)
             pos = 0
 
             # Packet counter
             if pos + 2 <= packet_length:
-                struct.pack_into('>H', packet, pos, pkt_num & 0xFFFF)
+                write_be_column(block, pos, pkt_nums & 0xFFFF, '>u2')
                 pos += 2
 
             # Timestamp
             if pos + 4 <= packet_length:
-                struct.pack_into('>I', packet, pos, (pkt_num * 1000) & 0xFFFFFFFF)
+                write_be_column(block, pos, (pkt_nums * 1000) & 0xFFFFFFFF, '>u4')
                 pos += 4
 
-            # Temperatures with drift
+            # Temperatures with drift (walks carry over between blocks)
             for i in range(4):
                 if pos + 2 > packet_length:
                     break
-                temps[i] += np.random.uniform(-0.1, 0.1)
-                temps[i] = np.clip(temps[i], 15.0, 40.0)
-                struct.pack_into('>H', packet, pos, int(temps[i] * 100) & 0xFFFF)
+                walk = clipped_walk(temps[i], temp_steps[:, i], 15.0, 40.0)
+                temps[i] = walk[-1]
+                write_be_column(block, pos, (walk * 100).astype(np.int64) & 0xFFFF, '>u2')
                 pos += 2
 
             # Voltages with drift
             for i in range(4):
                 if pos + 2 > packet_length:
                     break
-                volts[i] += np.random.uniform(-0.01, 0.01)
-                volts[i] = np.clip(volts[i], 3.0, 3.6)
-                struct.pack_into('>H', packet, pos, int(volts[i] * 1000) & 0xFFFF)
+                walk = clipped_walk(volts[i], volt_steps[:, i], 3.0, 3.6)
+                volts[i] = walk[-1]
+                write_be_column(block, pos, (walk * 1000).astype(np.int64) & 0xFFFF, '>u2')
                 pos += 2
 
-            # Fill rest
-            while pos < packet_length:
-                packet[pos] = 0x00 if np.random.random() > 0.01 else np.random.randint(0, 256)
-                pos += 1
-
-            data.extend(packet)
-
-    elif pattern == "predictable":
-        for pkt_num in range(num_packets):
-            packet = bytearray(packet_length)
-            packet[0] = pkt_num & 0xFF
-            packet[1] = (pkt_num >> 8) & 0xFF
-            for i in range(2, packet_length):
-                packet[i] = 0x55
-            data.extend(packet)
-
-    elif pattern == "entropy":
-        for pkt_num in range(num_packets):
-            np.random.seed(seed + pkt_num)
-            packet = bytes(np.random.randint(0, 256, packet_length, dtype=np.uint8))
-            data.extend(packet)
-
-    elif pattern == "edge":
-        patterns = [0x00, 0xFF, 0xAA, 0x55, 0x0F, 0xF0]
-        for pkt_num in range(num_packets):
-            val = patterns[pkt_num % len(patterns)]
-            packet = bytes([val] * packet_length)
-            data.extend(packet)
+            # Fill rest: zero, except ~1% of bytes random (one Bernoulli mask)
+            tail = packet_length - pos
+            if tail > 0:
+                noisy = rng.random((n, tail)) < 0.01
+                noise = rng.integers(0, 256, (n, tail), dtype=np.uint8)
+                block[:, pos:] = np.where(noisy, noise, 0)
 
-    else:
-        # Default: zeros
-        data = bytearray(num_packets * packet_length)
+            yield block
+        return
+
+    if pattern == "entropy":
+        # One Generator for the whole stream; reseeding per packet is slow
+        rng = np.random.default_rng(seed)
+        for first in range(0, num_packets, chunk_packets):
+            n = min(chunk_packets, num_packets - first)
+            yield rng.integers(0, 256, (n, packet_length), dtype=np.uint8)
+        return
+
+    for first in range(0, num_packets, chunk_packets):
+        pkt_nums = np.arange(first, min(num_packets, first + chunk_packets))
 
-    return bytes(data)
+        if pattern == "predictable":
+            # 16-bit little-endian packet number, then 0x55 filler
+            block = np.full((len(pkt_nums), packet_length), 0x55, dtype=np.uint8)
+            block[:, 0] = pkt_nums & 0xFF
+            block[:, 1] = (pkt_nums >> 8) & 0xFF
+
+        elif pattern == "edge":
+            # Each packet is one byte value, cycling through the patterns
+            values = EDGE_PATTERNS[pkt_nums % len(EDGE_PATTERNS)]
+            block = np.repeat(values[:, np.newaxis], packet_length, axis=1)
+
+        else:
+            # Default: zeros
+            block = np.zeros((len(pkt_nums), packet_length), dtype=np.uint8)
+
+        yield block
 
 
 def compress_with_impl(impl_path: Path, input_file: Path, packet_length: int,
                        r_value: int, pt: int = 10, ft: int = 20, rt: int = 50) -> Optional[Path]:
     """Compress using implementation CLI."""
     try:
-        subprocess.run(
+        # stdout is never used, so don't pipe it; stderr is kept for errors
+        result = subprocess.run(
             [str(impl_path), str(input_file), str(packet_length),
              str(pt), str(ft), str(rt), str(r_value)],
             cwd=input_file.parent,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=600
         )
         compressed = Path(str(input_file) + ".pkt")
-        return compressed if compressed.exists() else None
+        if compressed.exists():
+            return compressed
+        if result.stderr:
+            print(f"    Compression error: {result.stderr.decode(errors='replace').strip()}")
+        return None
     except Exception as e:
         print(f"    Compression error: {e}")
         return None
 
 
-def parse_compressed_packets(data: bytes, num_packets: int) -> List[bytes]:
-    """Parse compressed data into approximate packets."""
+def map_file(path: Path) -> memoryview:
+    """Memory-map a file read-only and return a view of it.
+
+    The mapping is unmapped once the last view (or slice) of it is gone.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def drop_cached_pages(*paths: Path):
+    """Advise the kernel that files just written won't be read again soon.
+
+    Large runs write far more than they re-read, so dropping the files'
+    clean pages keeps them from evicting hotter page cache. Pages not yet
+    written back are left alone (no sync is forced). A no-op where
+    posix_fadvise is unavailable.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def parse_compressed_packets(data: Union[bytes, memoryview], num_packets: int) -> List[memoryview]:
+    """Parse compressed data into approximate packets (zero-copy slices)."""
     if num_packets <= 0:
         return []
 
-    # Distribute bytes evenly, with remainder spread across first packets
-    base_size = len(data) // num_packets
-    remainder = len(data) % num_packets
+    # Distribute bytes evenly, with remainder spread across first packets:
+    # the first 'remainder' packets get 1 extra byte
+    base_size, remainder = divmod(len(data), num_packets)
+    sizes = np.full(num_packets, base_size, dtype=np.int64)
+    sizes[:remainder] += 1
+    ends = np.cumsum(sizes).tolist()
+    starts = [0] + ends[:-1]
+
+    view = memoryview(data)
+    return [view[start:end] for start, end in zip(starts, ends)]
+
 
-    packets = []
-    offset = 0
+@functools.lru_cache(maxsize=64)
+def _zeros(n: int) -> bytes:
+    """All-zero payload of length n (shared, immutable)."""
+    return bytes(n)
 
-    for i in range(num_packets):
-        # Add 1 extra byte to first 'remainder' packets
-        pkt_size = base_size + (1 if i < remainder else 0)
-        packets.append(data[offset:offset + pkt_size])
-        offset += pkt_size
 
-    return packets
+@functools.lru_cache(maxsize=64)
+def _ones(n: int) -> bytes:
+    """All-0xFF payload of length n (shared, immutable)."""
+    return b'\xff' * n
 
 
 def corrupt_packet(data: bytes, mtype: MalformedType, seed: int) -> bytes:
     """Corrupt a packet according to malformed type."""
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
     arr = bytearray(data)
 
     if mtype == MalformedType.TRUNCATED:
         return bytes(arr[:len(arr)//2])
     elif mtype == MalformedType.BIT_FLIPS:
-        for _ in range(max(1, len(arr) // 8)):
-            if arr:
-                pos = np.random.randint(0, len(arr))
-                arr[pos] ^= (1 << np.random.randint(0, 8))
-        return bytes(arr)
+        if not arr:
+            return bytes(arr)
+        # Draw every flip at once; xor.at applies repeated positions in turn
+        n_flips = max(1, len(arr) // 8)
+        positions = rng.integers(0, len(arr), n_flips)
+        bits = rng.integers(0, 8, n_flips, dtype=np.uint8)
+        flipped = np.frombuffer(arr, dtype=np.uint8)
+        np.bitwise_xor.at(flipped, positions, np.left_shift(1, bits, dtype=np.uint8))
+        return flipped.tobytes()
     elif mtype == MalformedType.ZEROS:
-        return bytes(len(arr))
+        return _zeros(len(arr))
     elif mtype == MalformedType.ONES:
-        return bytes([0xFF] * len(arr))
+        return _ones(len(arr))
     elif mtype == MalformedType.RANDOM:
-        return bytes(np.random.randint(0, 256, len(arr), dtype=np.uint8))
+        return rng.bytes(len(arr))
 
     return bytes(arr)
 
@@ -264,57 +383,97 @@ def write_faulted_stream(
 ) -> Tuple[List[PacketInfo], int, int, int]:
     """Write compressed stream with optional fault injection."""
     infos = []
-    num_normal = 0
-    num_lost = 0
-    num_malformed = 0
-    malform_idx = 0
     malform_types = [MalformedType.TRUNCATED, MalformedType.BIT_FLIPS,
                      MalformedType.ZEROS, MalformedType.RANDOM]
 
+    # Decide every packet's fate up front: malformed takes priority over lost
+    idx = np.arange(len(packets))
+    is_malformed = np.zeros(len(packets), dtype=bool)
+    is_lost = np.zeros(len(packets), dtype=bool)
+    if inject_malformed and malformed_frequency > 0:
+        is_malformed = (idx > 0) & (idx % malformed_frequency == 0)
+    if inject_lost and lost_frequency > 0:
+        is_lost = (idx > 0) & (idx % lost_frequency == 0) & ~is_malformed
+
+    kinds = np.full(len(packets), PacketType.NORMAL, dtype=np.uint8)
+    kinds[is_malformed] = PacketType.MALFORMED
+    kinds[is_lost] = PacketType.LOST
+    # Malformed packets cycle through the malformed types in order
+    malform_ix = ((np.cumsum(is_malformed) - 1) % len(malform_types)).tolist()
+
+    num_malformed = int(is_malformed.sum())
+    num_lost = int(is_lost.sum())
+    num_normal = len(packets) - num_malformed - num_lost
+
+    # Hot-loop locals: plain ints instead of IntEnum members, and bound
+    # methods instead of attribute lookups on every packet
+    NORMAL, MALFORMED, LOST = int(PacketType.NORMAL), int(PacketType.MALFORMED), int(PacketType.LOST)
+    mtypes = [int(m) for m in malform_types]
+    rec_size = _REC.size
+
+    # First pass: build records and work out their offsets
+    records = []
+    add_record = records.append
+    add_info = infos.append
+    offset = _HDR.size
+
+    for i, (pkt_data, kind) in enumerate(zip(packets, kinds.tolist())):
+        orig_len = len(pkt_data)
+
+        if kind == NORMAL:
+            add_record((NORMAL, 0, pkt_data))
+            add_info(PacketInfo(i, NORMAL, 0, offset, orig_len, orig_len))
+            offset += rec_size + orig_len
+
+        elif kind == MALFORMED:
+            mtype = mtypes[malform_ix[i]]
+            corrupted = corrupt_packet(pkt_data, mtype, seed + i)
+
+            add_record((MALFORMED, mtype, corrupted))
+            add_info(PacketInfo(i, MALFORMED, mtype, offset, orig_len, len(corrupted)))
+            offset += rec_size + len(corrupted)
+
+        else:
+            add_record((LOST, 0, b''))
+            add_info(PacketInfo(i, LOST, 0, offset, orig_len, 0))
+            offset += rec_size
+
+    # Second pass: pack records into a fixed-size buffer and write it out
+    # whenever it fills, so the stream is written in a few large writes
+    # without holding a second copy of it in memory
+    buf = bytearray(WRITE_BUFFER_SIZE)
+    buf_size = len(buf)
+    view = memoryview(buf)
+    pack_rec = _REC.pack
+    pack_rec_into = _REC.pack_into
+    _HDR.pack_into(buf, 0, MAGIC, VERSION, r_value, packet_length, len(packets))
+    pos = _HDR.size
+
     with open(output_file, 'wb') as f:
-        # Header
-        f.write(MAGIC)
-        f.write(struct.pack('>B', VERSION))
-        f.write(struct.pack('>B', r_value))
-        f.write(struct.pack('>H', packet_length))
-        f.write(struct.pack('>I', len(packets)))
-
-        for i, pkt_data in enumerate(packets):
-            offset = f.tell()
-            orig_len = len(pkt_data)
-
-            # Check malformed first (priority)
-            if inject_malformed and malformed_frequency > 0 and i > 0 and i % malformed_frequency == 0:
-                mtype = malform_types[malform_idx % len(malform_types)]
-                malform_idx += 1
-                corrupted = corrupt_packet(pkt_data, mtype, seed + i)
-
-                f.write(struct.pack('>H', len(corrupted)))
-                f.write(struct.pack('>B', PacketType.MALFORMED))
-                f.write(struct.pack('>B', mtype))
-                f.write(corrupted)
-
-                infos.append(PacketInfo(i, PacketType.MALFORMED, mtype, offset, orig_len, len(corrupted)))
-                num_malformed += 1
-
-            # Check lost
-            elif inject_lost and lost_frequency > 0 and i > 0 and i % lost_frequency == 0:
-                f.write(struct.pack('>H', 0))
-                f.write(struct.pack('>B', PacketType.LOST))
-                f.write(struct.pack('>B', 0))
-
-                infos.append(PacketInfo(i, PacketType.LOST, 0, offset, orig_len, 0))
-                num_lost += 1
-
-            # Normal
-            else:
-                f.write(struct.pack('>H', len(pkt_data)))
-                f.write(struct.pack('>B', PacketType.NORMAL))
-                f.write(struct.pack('>B', 0))
-                f.write(pkt_data)
-
-                infos.append(PacketInfo(i, PacketType.NORMAL, 0, offset, orig_len, len(pkt_data)))
-                num_normal += 1
+        # The first pass's running offset is the exact stream size, so the
+        # file can be given its extents up front where that is supported
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(f.fileno(), 0, offset)
+            except OSError:
+                pass
+        write = f.write
+        for ptype, subtype, payload in records:
+            n = len(payload)
+            if pos + rec_size + n > buf_size:
+                write(view[:pos])
+                pos = 0
+                if rec_size + n > buf_size:
+                    # Larger than the buffer: write it straight through
+                    write(pack_rec(n, ptype, subtype))
+                    write(payload)
+                    continue
+            pack_rec_into(buf, pos, n, ptype, subtype)
+            pos += rec_size
+            buf[pos:pos + n] = payload
+            pos += n
+        write(view[:pos])
+    view.release()
 
     return infos, num_normal, num_lost, num_malformed
 
@@ -338,10 +497,17 @@ def generate_vector(
 
     # Generate input
     input_file = output_dir / f"{name}_input.bin"
-    input_data = generate_input_data(pattern, num_packets, packet_length, seed)
+    # Each block is hashed and written while it is still in cache, and only
+    # one block is held in memory at a time
+    hasher = hashlib.sha256()
+    input_size = 0
     with open(input_file, 'wb') as f:
-        f.write(input_data)
-    input_md5 = calculate_md5(input_data)
+        for chunk in generate_input_chunks(pattern, num_packets, packet_length, seed):
+            view = memoryview(chunk)
+            hasher.update(view)
+            f.write(view)
+            input_size += chunk.nbytes
+    input_sha256 = hasher.hexdigest()
 
     # Compress
     compressed_file = compress_with_impl(impl_path, input_file, packet_length, r_value)
@@ -349,15 +515,15 @@ def generate_vector(
         print(f"    ERROR: Compression failed")
         return None
 
-    with open(compressed_file, 'rb') as f:
-        compressed_data = f.read()
-    compressed_md5 = calculate_md5(compressed_data)
+    compressed_data = map_file(compressed_file)
+    compressed_sha256 = calculate_sha256(compressed_data)
 
     # Rename compressed file
     clean_file = output_dir / f"{name}_compressed.pkt"
     compressed_file.rename(clean_file)
+    data_files = [input_file, clean_file]
 
-    ratio = len(input_data) / len(compressed_data) if compressed_data else 0
+    ratio = input_size / len(compressed_data) if compressed_data else 0
     print(f"    Compressed: {len(compressed_data):,} bytes (ratio: {ratio:.2f}x)")
 
     info = TestVectorInfo(
@@ -368,10 +534,10 @@ def generate_vector(
         pattern=pattern,
         seed=seed,
         input_file=input_file.name,
-        input_md5=input_md5,
-        input_size=len(input_data),
+        input_sha256=input_sha256,
+        input_size=input_size,
         compressed_file=clean_file.name,
-        compressed_md5=compressed_md5,
+        compressed_sha256=compressed_sha256,
         compressed_size=len(compressed_data),
         inject_lost=inject_lost,
         lost_frequency=lost_frequency if inject_lost else 0,
@@ -392,11 +558,13 @@ def generate_vector(
         )
 
         info.faulted_file = faulted_file.name
+        data_files.append(faulted_file)
         info.faulted_size = faulted_file.stat().st_size
         info.num_normal = num_normal
         info.num_lost = num_lost
         info.num_malformed = num_malformed
         info.packets = [asdict(p) for p in infos]
+        del packets
 
         print(f"    Faulted: {num_normal} normal, {num_lost} lost, {num_malformed} malformed")
     else:
@@ -411,6 +579,11 @@ def generate_vector(
             meta_dict['packets'] = f"[{len(info.packets)} packets - see full file]"
         json.dump(meta_dict, f, indent=2)
 
+    # The vector is complete; unmap the compressed stream and keep the
+    # data files from crowding the page cache
+    del compressed_data
+    drop_cached_pages(*data_files)
+
     return info
 
 
@@ -483,6 +656,10 @@ Examples:
     parser.add_argument('--seed', type=int, default=42,
                         help='Random seed for reproducibility (default: 42)')
 
+    # Parallelism
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Vectors to generate in parallel (default: CPU count)')
+
     args = parser.parse_args()
 
     # Find implementation
@@ -525,6 +702,7 @@ Examples:
     print(f"Packet sizes:  {packet_sizes}")
     print(f"Patterns:      {patterns}")
     print(f"Seed:          {args.seed}")
+    print(f"Jobs:          {args.jobs}")
     print(f"Implementation: {impl_path}")
 
     if args.inject_lost or args.inject_malformed:
@@ -538,19 +716,16 @@ Examples:
     num_combos = len(r_values) * len(packet_sizes) * len(patterns)
     size_per_vector = target_size // max(1, num_combos)
 
-    all_infos = []
-
-    print(f"\nGenerating {num_combos} test vectors...")
-
+    # Each vector is independent (own seed, own files), so they can be
+    # generated in parallel; results are kept in combo order
+    combos = []
     for r in r_values:
         for pkt_size in packet_sizes:
             for pattern in patterns:
                 num_packets = max(200, size_per_vector // pkt_size)
-                name = f"R{r}_F{pkt_size*8}_{pattern}"
-
-                info = generate_vector(
+                combos.append(dict(
                     output_dir=args.output_dir,
-                    name=name,
+                    name=f"R{r}_F{pkt_size*8}_{pattern}",
                     r_value=r,
                     packet_length=pkt_size,
                     num_packets=num_packets,
@@ -561,10 +736,18 @@ Examples:
                     lost_frequency=args.lost_frequency,
                     inject_malformed=args.inject_malformed,
                     malformed_frequency=args.malformed_frequency
-                )
+                ))
+
+    print(f"\nGenerating {num_combos} test vectors...")
+
+    if args.jobs > 1 and len(combos) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(combos))) as ex:
+            futures = [ex.submit(generate_vector, **kw) for kw in combos]
+            results = [f.result() for f in futures]
+    else:
+        results = [generate_vector(**kw) for kw in combos]
 
-                if info:
-                    all_infos.append(info)
+    all_infos = [info for info in results if info]
 
     # Write manifest
     manifest = {
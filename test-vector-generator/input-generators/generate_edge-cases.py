@@ -8,7 +8,7 @@ import yaml
 import numpy as np
 from pathlib import Path
 from common import (
-    PacketGenerator, create_empty_packet, write_random_bytes,
+    PacketGenerator, write_random_bytes,
     write_repeating_sequence, set_deterministic_seed
 )
 
@@ -24,11 +24,9 @@ class EdgeCasesPacketGenerator(PacketGenerator):
 
         self.config = config
 
-    def generate_packet(self, packet_num: int) -> bytearray:
-        """Generate edge case patterns - mixed stable/changing sections."""
-        packet = create_empty_packet(self.packet_length)
-
-        # Create packets with mixed sections:
+    def fill_template(self, packet: memoryview):
+        """Write the stable sections shared by every packet."""
+        # Packets have mixed sections:
         # - Some bytes stay completely stable
         # - Other bytes change gradually
         # This avoids having all 90 bytes change at once
@@ -36,15 +34,21 @@ class EdgeCasesPacketGenerator(PacketGenerator):
         # Bytes 0-29: Completely stable (always zeros)
         write_repeating_sequence(packet, (0, 29), [0x00])
 
+        # Bytes 60-89: Completely stable (always 0xFF)
+        write_repeating_sequence(packet, (60, 89), [0xFF])
+
+    def fill_packet(self, packet_num: int, packet: memoryview):
+        """Write the changing section of an edge case packet."""
         # Bytes 30-59: Step-wise changing value
         # Changes every 25 packets
         value = ((packet_num // 25) * 5) % 256
         write_repeating_sequence(packet, (30, 59), [value])
 
-        # Bytes 60-89: Completely stable (always 0xFF)
-        write_repeating_sequence(packet, (60, 89), [0xFF])
-
-        return packet
+    def fill_all(self, rows: np.ndarray):
+        """Fill all packets at once with a single broadcast store."""
+        # Bytes 30-59: Step-wise changing value
+        values = ((np.arange(self.num_packets) // 25) * 5) % 256
+        rows[:, 30:60] = values[:, np.newaxis]
 
 
 def main():
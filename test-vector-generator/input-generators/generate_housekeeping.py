@@ -9,14 +9,30 @@ import struct
 import numpy as np
 from pathlib import Path
 from common import (
-    PacketGenerator, create_empty_packet, write_value, write_float32,
-    calculate_crc16_ccitt, increment_counter, set_deterministic_seed
+    PacketGenerator, write_value, write_value_column, write_float32,
+    calculate_crc16_ccitt, set_deterministic_seed
 )
 
 
 class HousekeepingPacketGenerator(PacketGenerator):
     """Generator for realistic spacecraft housekeeping packets."""
 
+    # CCSDS Primary Header
+    # Packet Version Number (3 bits) = 0
+    # Packet Type (1 bit) = 0 (TM)
+    # Secondary Header Flag (1 bit) = 1
+    # APID (11 bits) = 1028
+    VERSION_TYPE_SEC_APID = (0 << 13) | (0 << 12) | (1 << 11) | 1028
+    # Packet Data Length (16 bits) - number of bytes in data field - 1
+    DATA_LENGTH = 0x0053  # 83 bytes of data = 0x53
+    # CRC-16 - use fixed pattern instead of calculating
+    # Real CRCs are high-entropy, so use stable value for better compression
+    CRC = 0xA5A5
+
+    # Struct codes for (field width in bytes, signed)
+    FIELD_CODES = {(1, False): 'B', (2, False): 'H', (4, False): 'I', (8, False): 'Q',
+                   (4, True): 'i'}
+
     def __init__(self, config: dict):
         packet_length = config['input']['packet_length']
         num_packets = config['input']['num_packets']
@@ -25,150 +41,185 @@ class HousekeepingPacketGenerator(PacketGenerator):
 
         self.config = config
 
-        # Initialize counters
-        self.sequence_count = 0
-        self.timestamp = 0x08C91EF80E694003
-        self.cmd_counter = 0
-        self.tlm_counter = 0
-        self.uptime_ms = 0
+        # Counters for every packet; they all advance by a fixed step per
+        # packet, so each is one column computed from the packet number
+        packet_nums = np.arange(num_packets, dtype=np.uint64)
+        # Sequence Flags (2 bits) = 3 (standalone) | Sequence Count (14 bits)
+        self.seq_col = (3 << 14) | (packet_nums & 0x3FFF)
+        # Timestamp (8 bytes), +1000ms per packet
+        self.timestamp_col = np.uint64(0x08C91EF80E694003) + packet_nums * np.uint64(1000)
+        # Command and telemetry packet counters (4 bytes)
+        self.cmd_col = packet_nums & 0xFFFFFFFF
+        self.tlm_col = packet_nums & 0xFFFFFFFF
+        # Uptime in milliseconds (8 bytes)
+        self.uptime_col = packet_nums * np.uint64(1000)
 
         # Initialize sensor states
         # Use float values for internal state, but write as integers
         self.mode = 0x01  # NOMINAL
-        self.temp_states = [20.0, 25.0, 22.0]  # Will be scaled to integers
-        self.voltage_states = [3.3, 5.0]  # Will be scaled to integers
-        self.current_states = [0.5, 1.2]  # Will be scaled to integers
-        self.gyro_states = [0.0, 0.0, 0.1]  # Will be scaled to integers
-        self.accel_states = [0.0, 0.0, 9.81]  # Will be scaled to integers
         self.status_flags = 0x000000FF  # Low 8 bits set
 
-    def generate_packet(self, packet_num: int) -> bytearray:
-        """Generate a realistic housekeeping packet."""
-        packet = create_empty_packet(self.packet_length)
-
-        # CCSDS Primary Header (6 bytes)
-        # Packet Version Number (3 bits) = 0
-        # Packet Type (1 bit) = 0 (TM)
-        # Secondary Header Flag (1 bit) = 1
-        # APID (11 bits) = 1028
-        apid = 1028
-        version_type_sec_apid = (0 << 13) | (0 << 12) | (1 << 11) | apid
-        write_value(packet, (0, 1), version_type_sec_apid)
-
-        # Sequence Flags (2 bits) = 3 (standalone)
-        # Sequence Count (14 bits)
-        seq_flags_count = (3 << 14) | (self.sequence_count & 0x3FFF)
-        write_value(packet, (2, 3), seq_flags_count)
-        self.sequence_count = (self.sequence_count + 1) & 0x3FFF
-
-        # Packet Data Length (16 bits) - number of bytes in data field - 1
-        write_value(packet, (4, 5), 0x0053)  # 83 bytes of data = 0x53
-
-        # Timestamp (8 bytes) - incrementing
-        write_value(packet, (6, 13), self.timestamp)
-        self.timestamp = increment_counter(self.timestamp, 1000, 8)  # +1000ms
-
-        # Spacecraft Mode (1 byte)
-        # Occasionally change mode (0.1% chance)
-        np.random.seed(self.seed + packet_num * 10)
-        if np.random.random() < 0.001:
-            self.mode = np.random.choice([0x00, 0x01, 0x02])
-        packet[14] = self.mode
-
-        # Temperature sensors (12 bytes, 3x 4-byte integers, scaled by 100)
-        # Real spacecraft often uses integer scaling: temp_celsius * 100
-        # Changes slowly - only update every 50 packets
-        if packet_num % 50 == 0:
-            np.random.seed(self.seed + packet_num * 11)
-            for i, (nominal, variation) in enumerate([(20.0, 2.0), (25.0, 3.0), (22.0, 2.5)]):
-                change = np.random.normal(0, variation * 0.1)
-                self.temp_states[i] += change
-                self.temp_states[i] = np.clip(self.temp_states[i], nominal - variation, nominal + variation)
-
-        for i in range(3):
-            temp_scaled = int(self.temp_states[i] * 100)  # e.g., 20.5°C → 2050
-            write_value(packet, (15 + i * 4, 18 + i * 4), temp_scaled)
-
-        # Voltage monitors (8 bytes, 2x 4-byte integers, scaled by 1000)
-        # Changes very slowly - only every 100 packets
-        if packet_num % 100 == 0:
-            np.random.seed(self.seed + packet_num * 12)
-            for i, (nominal, variation) in enumerate([(3.3, 0.1), (5.0, 0.15)]):
-                change = np.random.normal(0, variation * 0.05)
-                self.voltage_states[i] += change
-                self.voltage_states[i] = np.clip(self.voltage_states[i], nominal - variation, nominal + variation)
-
-        for i in range(2):
-            voltage_scaled = int(self.voltage_states[i] * 1000)  # e.g., 3.3V → 3300
-            write_value(packet, (27 + i * 4, 30 + i * 4), voltage_scaled)
-
-        # Current sensors (8 bytes, 2x 4-byte integers, scaled by 1000)
-        # Changes moderately - every 25 packets
-        if packet_num % 25 == 0:
-            np.random.seed(self.seed + packet_num * 13)
-            for i, (nominal, variation) in enumerate([(0.5, 0.05), (1.2, 0.1)]):
-                change = np.random.normal(0, variation * 0.08)
-                self.current_states[i] += change
-                self.current_states[i] = np.clip(self.current_states[i], nominal - variation, nominal + variation)
-
-        for i in range(2):
-            current_scaled = int(self.current_states[i] * 1000)  # e.g., 0.5A → 500
-            write_value(packet, (35 + i * 4, 38 + i * 4), current_scaled)
-
-        # Status flags (4 bytes)
-        # Occasionally flip some bits
-        np.random.seed(self.seed + packet_num * 14)
-        if np.random.random() < 0.01:
-            bit_to_flip = np.random.randint(8, 11)  # Flip bits 8-10
-            self.status_flags ^= (1 << bit_to_flip)
-        write_value(packet, (43, 46), self.status_flags)
-
-        # Command counter (4 bytes)
-        write_value(packet, (47, 50), self.cmd_counter)
-        self.cmd_counter = increment_counter(self.cmd_counter, 1, 4)
-
-        # Telemetry packet counter (4 bytes)
-        write_value(packet, (51, 54), self.tlm_counter)
-        self.tlm_counter = increment_counter(self.tlm_counter, 1, 4)
-
-        # Uptime in milliseconds (8 bytes)
-        write_value(packet, (55, 62), self.uptime_ms)
-        self.uptime_ms = increment_counter(self.uptime_ms, 1000, 8)
-
-        # Gyroscope data (12 bytes, 3x 4-byte integers, scaled by 10000)
-        # Changes every 10 packets
-        if packet_num % 10 == 0:
-            np.random.seed(self.seed + packet_num * 15)
-            for i, (nominal, variation) in enumerate([(0.0, 0.05), (0.0, 0.05), (0.1, 0.1)]):
-                change = np.random.normal(0, variation * 0.3)
-                self.gyro_states[i] += change
-                self.gyro_states[i] = np.clip(self.gyro_states[i], nominal - variation, nominal + variation)
-
-        for i in range(3):
-            gyro_scaled = int(self.gyro_states[i] * 10000)  # e.g., 0.1 rad/s → 1000
-            write_value(packet, (63 + i * 4, 66 + i * 4), gyro_scaled, signed=True)
-
-        # Accelerometer data (12 bytes, 3x 4-byte integers, scaled by 1000)
-        # Changes every 20 packets
-        if packet_num % 20 == 0:
-            np.random.seed(self.seed + packet_num * 16)
-            for i, (nominal, variation) in enumerate([(0.0, 0.1), (0.0, 0.1), (9.81, 0.2)]):
-                change = np.random.normal(0, variation * 0.3)
-                self.accel_states[i] += change
-                self.accel_states[i] = np.clip(self.accel_states[i], nominal - variation, nominal + variation)
-
-        for i in range(3):
-            accel_scaled = int(self.accel_states[i] * 1000)  # e.g., 9.81 m/s² → 9810
-            write_value(packet, (75 + i * 4, 78 + i * 4), accel_scaled, signed=True)
-
-        # CRC-16 (2 bytes) - use fixed pattern instead of calculating
-        # Real CRCs are high-entropy, so use stable value for better compression
-        write_value(packet, (87, 88), 0xA5A5)
-
-        # Padding (1 byte)
-        packet[89] = 0x00
-
-        return packet
+        # One legacy (MT19937) stream, reseeded per update: reseeding is
+        # cheap, constructing a RandomState is not
+        self.legacy_rng = np.random.RandomState(seed)
+
+        # Precompute every packet's sensor readings, already scaled to the
+        # integers written to the packet (one row per packet). Each group
+        # is given as arrays: initial state, nominal value, variation
+        # Temperatures: changes slowly - only update every 50 packets
+        self.temp_hist = self.sensor_history(
+            [20.0, 25.0, 22.0], [20.0, 25.0, 22.0], [2.0, 3.0, 2.5],
+            stride=50, seed_step=11, factor=0.1, scale=100)  # 20.5°C → 2050
+        # Voltages: changes very slowly - only every 100 packets
+        self.voltage_hist = self.sensor_history(
+            [3.3, 5.0], [3.3, 5.0], [0.1, 0.15],
+            stride=100, seed_step=12, factor=0.05, scale=1000)  # 3.3V → 3300
+        # Currents: changes moderately - every 25 packets
+        self.current_hist = self.sensor_history(
+            [0.5, 1.2], [0.5, 1.2], [0.05, 0.1],
+            stride=25, seed_step=13, factor=0.08, scale=1000)  # 0.5A → 500
+        # Gyroscope: changes every 10 packets
+        self.gyro_hist = self.sensor_history(
+            [0.0, 0.0, 0.1], [0.0, 0.0, 0.1], [0.05, 0.05, 0.1],
+            stride=10, seed_step=15, factor=0.3, scale=10000)  # 0.1 rad/s → 1000
+        # Accelerometer: changes every 20 packets
+        self.accel_hist = self.sensor_history(
+            [0.0, 0.0, 9.81], [0.0, 0.0, 9.81], [0.1, 0.1, 0.2],
+            stride=20, seed_step=16, factor=0.3, scale=1000)  # 9.81 m/s² → 9810
+
+        # Spacecraft mode and status flags for every packet
+        self.modes, self.status = self.mode_status_columns()
+
+        # The packet layout, used by both fill_all and fill_packet
+        self.fields = self.packet_fields()
+        self.layout = struct.Struct('>' + ''.join(
+            self.FIELD_CODES[(end - start + 1, signed)]
+            for (start, end), _, signed in self.fields))
+
+    def packet_fields(self) -> list:
+        """Return the packet layout as (positions, values, signed) per field.
+
+        Fields are listed in byte order and cover the whole packet.
+        ``values`` is an int for fields that are the same in every packet,
+        else a column with one value per packet.
+        """
+        fields = [
+            # CCSDS Primary Header (6 bytes)
+            ((0, 1), self.VERSION_TYPE_SEC_APID, False),
+            ((2, 3), self.seq_col, False),
+            ((4, 5), self.DATA_LENGTH, False),
+            # Timestamp (8 bytes)
+            ((6, 13), self.timestamp_col, False),
+            # Spacecraft Mode (1 byte)
+            ((14, 14), self.modes, False),
+        ]
+        # Temperature sensors (3x 4 bytes, scaled by 100)
+        fields += [((15 + i * 4, 18 + i * 4), self.temp_hist[:, i], False) for i in range(3)]
+        # Voltage monitors (2x 4 bytes, scaled by 1000)
+        fields += [((27 + i * 4, 30 + i * 4), self.voltage_hist[:, i], False) for i in range(2)]
+        # Current sensors (2x 4 bytes, scaled by 1000)
+        fields += [((35 + i * 4, 38 + i * 4), self.current_hist[:, i], False) for i in range(2)]
+        fields += [
+            # Status flags, command and telemetry counters (4 bytes each)
+            ((43, 46), self.status, False),
+            ((47, 50), self.cmd_col, False),
+            ((51, 54), self.tlm_col, False),
+            # Uptime in milliseconds (8 bytes)
+            ((55, 62), self.uptime_col, False),
+        ]
+        # Gyroscope (3x 4 bytes, scaled by 10000) and accelerometer
+        # (3x 4 bytes, scaled by 1000), signed
+        fields += [((63 + i * 4, 66 + i * 4), self.gyro_hist[:, i], True) for i in range(3)]
+        fields += [((75 + i * 4, 78 + i * 4), self.accel_hist[:, i], True) for i in range(3)]
+        fields += [
+            # CRC-16 (2 bytes) and padding (1 byte)
+            ((87, 88), self.CRC, False),
+            ((89, 89), 0x00, False),
+        ]
+
+        # The fields must tile the packet for the Struct layout to match
+        offset = 0
+        for (start, end), _, _ in fields:
+            if start != offset:
+                raise ValueError(f"Housekeeping field at byte {start} does not follow byte {offset - 1}")
+            offset = end + 1
+        if offset != self.packet_length:
+            raise ValueError(f"Housekeeping fields cover {offset} bytes, packet is {self.packet_length}")
+        return fields
+
+    def sensor_history(self, initial: list, nominal: list, variation: list, stride: int,
+                       seed_step: int, factor: float, scale: int) -> np.ndarray:
+        """Return scaled readings of one sensor group for every packet.
+
+        The group takes a clipped random-walk step every ``stride`` packets,
+        drawn from the seed ``seed + packet_num * seed_step``. Only those
+        packets draw random numbers; the readings in between are repeated.
+        The group's state is one array, so each step is a single normal
+        draw, add and clip over all of its sensors.
+        """
+        rs = self.legacy_rng
+        states = np.array(initial, dtype=np.float64)
+        nominal = np.array(nominal, dtype=np.float64)
+        variation = np.array(variation, dtype=np.float64)
+        step_scale = variation * factor
+        low = nominal - variation
+        high = nominal + variation
+
+        update_packets = range(0, self.num_packets, stride)
+        history = np.empty((len(update_packets), len(states)), dtype=np.int32)
+        for row, packet_num in enumerate(update_packets):
+            rs.seed(self.seed + packet_num * seed_step)
+            states += rs.normal(0, step_scale)
+            np.clip(states, low, high, out=states)
+            history[row] = states * scale  # truncates like int()
+        return np.repeat(history, stride, axis=0)[:self.num_packets]
+
+    def fill_template(self, packet: memoryview):
+        """Write the header and trailer fields shared by every packet."""
+        for positions, values, signed in self.fields:
+            if isinstance(values, int):
+                write_value(packet, positions, values, signed=signed)
+
+    def fill_packet(self, packet_num: int, packet: memoryview):
+        """Write a realistic housekeeping packet with a single pack_into."""
+        # Counters and sensors are precomputed (sensors already scaled to
+        # integers); mode and status flags occasionally change
+        self.layout.pack_into(packet, 0, *[
+            values if isinstance(values, int) else values[packet_num]
+            for _, values, _ in self.fields])
+
+    def mode_status_columns(self):
+        """Return every packet's spacecraft mode and status flags.
+
+        Packet n changes mode when the first draw after seeding with
+        ``seed + n * 10`` is below 0.001, and flips a status bit when the
+        first draw after ``seed + n * 14`` is below 0.01.
+        """
+        rs = self.legacy_rng
+        modes = np.empty(self.num_packets, dtype=np.uint8)
+        flips = np.zeros(self.num_packets, dtype=np.uint32)
+        mode = self.mode
+        for packet_num in range(self.num_packets):
+            # Occasionally change mode (0.1% chance); the mode then persists
+            rs.seed(self.seed + packet_num * 10)
+            if rs.random_sample() < 0.001:
+                # choice([0x00, 0x01, 0x02]) draws this same randint internally
+                mode = rs.randint(0x00, 0x03)
+            modes[packet_num] = mode
+
+            # Occasionally flip one of bits 8-10; flips accumulate
+            rs.seed(self.seed + packet_num * 14)
+            if rs.random_sample() < 0.01:
+                flips[packet_num] = 1 << rs.randint(8, 11)  # Flip bits 8-10
+        status = self.status_flags ^ np.bitwise_xor.accumulate(flips)
+
+        return modes, status
+
+    def fill_all(self, rows: np.ndarray):
+        """Fill all packets at once, one array store per changing field."""
+        for positions, values, _ in self.fields:
+            if not isinstance(values, int):
+                write_value_column(rows, positions, values)
 
 
 def main():
@@ -5,9 +5,10 @@ This creates predictable data ideal for quick validation and testing.
 """
 import sys
 import yaml
+import numpy as np
 from pathlib import Path
 from common import (
-    PacketGenerator, create_empty_packet, write_value,
+    PacketGenerator, write_value, write_value_column,
     write_repeating_sequence, write_random_bytes, increment_counter
 )
 
@@ -24,25 +25,14 @@ class SimplePacketGenerator(PacketGenerator):
         self.config = config
         self.counter_value = 0x0000
 
-    def generate_packet(self, packet_num: int) -> bytearray:
-        """Generate a single simple packet with defined patterns."""
-        packet = create_empty_packet(self.packet_length)
-
+    def fill_template(self, packet: memoryview):
+        """Write the patterns that are the same in every packet."""
         # Pattern 1: Repeating sequence at start (bytes 0-3)
         write_repeating_sequence(packet, (0, 3), [0x08, 0xD4, 0xF1, 0xAB])
 
-        # Pattern 2: Incrementing counter (bytes 4-5)
-        write_value(packet, (4, 5), self.counter_value)
-        self.counter_value = increment_counter(self.counter_value, 1, 2)
-
         # Pattern 3: Stable values (bytes 6-13)
         write_repeating_sequence(packet, (6, 13), [0x00])
 
-        # Pattern 4: Slow changing value (bytes 14-17)
-        # Changes every 10 packets
-        slow_value = 0x12345678 + (packet_num // 10)
-        write_value(packet, (14, 17), slow_value & 0xFFFFFFFF)
-
         # Pattern 5: Stable temperature readings (bytes 18-25)
         # Simulates stable sensor readings
         write_repeating_sequence(packet, (18, 25), [0xFF, 0xFF])
@@ -50,16 +40,39 @@ class SimplePacketGenerator(PacketGenerator):
         # Pattern 6: More stable zeros (bytes 26-49)
         write_repeating_sequence(packet, (26, 49), [0x00])
 
+        # Pattern 8: Repeating pattern (bytes 54-89)
+        # Simple repeating sequence that compresses well
+        write_repeating_sequence(packet, (54, 89), [0x01, 0x02, 0x03, 0x04])
+
+    def fill_packet(self, packet_num: int, packet: memoryview):
+        """Write the changing patterns of a single simple packet."""
+        # Pattern 2: Incrementing counter (bytes 4-5)
+        write_value(packet, (4, 5), self.counter_value)
+        self.counter_value = increment_counter(self.counter_value, 1, 2)
+
+        # Pattern 4: Slow changing value (bytes 14-17)
+        # Changes every 10 packets
+        slow_value = 0x12345678 + (packet_num // 10)
+        write_value(packet, (14, 17), slow_value & 0xFFFFFFFF)
+
         # Pattern 7: Very slow changing value (bytes 50-53)
         # Changes every 25 packets
         slow_value2 = 0xABCDEF00 + (packet_num // 25)
         write_value(packet, (50, 53), slow_value2 & 0xFFFFFFFF)
 
-        # Pattern 8: Repeating pattern (bytes 54-89)
-        # Simple repeating sequence that compresses well
-        write_repeating_sequence(packet, (54, 89), [0x01, 0x02, 0x03, 0x04])
+    def fill_all(self, rows: np.ndarray):
+        """Fill all packets at once, one array store per changing field."""
+        packet_nums = np.arange(self.num_packets, dtype=np.int64)
+
+        # Pattern 2: Incrementing counter (bytes 4-5)
+        write_value_column(rows, (4, 5), (self.counter_value + packet_nums) & 0xFFFF)
+        self.counter_value = increment_counter(self.counter_value, self.num_packets, 2)
 
-        return packet
+        # Pattern 4: Slow changing value (bytes 14-17)
+        write_value_column(rows, (14, 17), (0x12345678 + packet_nums // 10) & 0xFFFFFFFF)
+
+        # Pattern 7: Very slow changing value (bytes 50-53)
+        write_value_column(rows, (50, 53), (0xABCDEF00 + packet_nums // 25) & 0xFFFFFFFF)
 
 
 def main():
@@ -4,6 +4,7 @@
 
 set -e
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 WORKSPACE_DIR="/workspace"
 OUTPUT_DIR="${WORKSPACE_DIR}/output/vectors"
 REPO_TEST_VECTORS="/repo/test-vectors"
@@ -58,6 +59,10 @@ copy_vector "housekeeping"
 copy_vector "edge-cases"
 copy_vector "venus-express"
 
+# Rebuild the manifest the test suites load instead of scanning metadata
+python3 "${SCRIPT_DIR}/write_manifest.py" "${REPO_TEST_VECTORS}"
+echo ""
+
 echo "=========================================="
 echo "Test vectors copied successfully!"
 echo "=========================================="
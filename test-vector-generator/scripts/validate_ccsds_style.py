@@ -16,6 +16,8 @@ Usage:
 import argparse
 import ctypes
 import json
+import mmap
+import re
 import struct
 import sys
 from pathlib import Path
@@ -31,8 +33,24 @@ class PacketType(IntEnum):
     MALFORMED = 2
 
 
+# Plain int values of the packet types, for per-packet code
+_NORMAL, _LOST, _MALFORMED = int(PacketType.NORMAL), int(PacketType.LOST), int(PacketType.MALFORMED)
+
 MAGIC = b'PKT+'
 
+# A run of LOST packets in a string of packet types, plus the NORMAL or
+# MALFORMED packet that ends it, if any (other types don't end a run)
+_LOST_RUN = re.compile(b'%c[^%c%c]*[%c%c]?' % (
+    _LOST, _NORMAL, _MALFORMED, _NORMAL, _MALFORMED))
+
+# Notes kept per vector result
+MAX_NOTES = 10
+
+# Stream header: magic, version, R, packet length, packet count
+_HDR = struct.Struct('>4sBBHI')
+# Per-packet record header: data length, type, subtype
+_PKT = struct.Struct('>HBB')
+
 
 @dataclass
 class ValidationResult:
@@ -53,33 +71,42 @@ def read_faulted_stream(filepath: Path) -> Tuple[int, int, int, List[Tuple[int,
     """
     Read faulted compressed stream.
 
+    The header is read directly; the packet records are then parsed in
+    place from a memory mapping with precompiled Structs. Packets are
+    small, so copying each one out of the mapping as bytes is cheaper
+    than creating a memoryview slice per packet. Short or truncated
+    files raise ValueError.
+
     Returns: (r_value, packet_length, num_packets, [(type, subtype, data), ...])
     """
     packets = []
 
     with open(filepath, 'rb') as f:
-        # Read header
-        magic = f.read(4)
+        # Read header (a plain read: an empty file can't be mapped)
+        header = f.read(_HDR.size)
+        magic = header[:4]
         if magic != MAGIC:
             raise ValueError(f"Invalid magic: {magic}")
-
-        version = struct.unpack('>B', f.read(1))[0]
-        r_value = struct.unpack('>B', f.read(1))[0]
-        packet_length = struct.unpack('>H', f.read(2))[0]
-        num_packets = struct.unpack('>I', f.read(4))[0]
-
-        # Read packets
-        for _ in range(num_packets):
-            pkt_len = struct.unpack('>H', f.read(2))[0]
-            pkt_type = struct.unpack('>B', f.read(1))[0]
-            pkt_subtype = struct.unpack('>B', f.read(1))[0]
-
-            if pkt_len > 0:
-                pkt_data = f.read(pkt_len)
-            else:
-                pkt_data = b''
-
-            packets.append((pkt_type, pkt_subtype, pkt_data))
+        if len(header) < _HDR.size:
+            raise ValueError(f"Truncated stream: header is {len(header)} bytes")
+
+        magic, version, r_value, packet_length, num_packets = _HDR.unpack(header)
+        offset = _HDR.size
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Read packets
+            unpack_pkt = _PKT.unpack_from
+            pkt_size = _PKT.size
+            size = len(mm)
+            append = packets.append
+            for i in range(num_packets):
+                if offset + pkt_size > size:
+                    raise ValueError(
+                        f"Truncated stream: packet {i} header at offset {offset}")
+                pkt_len, pkt_type, pkt_subtype = unpack_pkt(mm, offset)
+                offset += pkt_size
+                append((pkt_type, pkt_subtype, mm[offset:offset + pkt_len]))
+                offset += pkt_len
 
     return r_value, packet_length, num_packets, packets
 
@@ -119,60 +146,44 @@ def validate_with_c_library(
             overall_pass=False, notes=[f"Failed to read faulted file: {e}"]
         )
 
-    # Read original input for verification
+    # Packet contents aren't compared against the original input yet, so
+    # only check that it exists instead of reading the whole file
     input_file = vector_dir / vector_info['input_file']
-    if input_file.exists():
-        with open(input_file, 'rb') as f:
-            original_input = f.read()
-    else:
-        original_input = None
+    if not input_file.exists():
         notes.append("Original input not found, skipping content verification")
 
     # Statistics
-    normal_ok = 0
     normal_fail = 0
-    lost_handled = 0
     lost_recovery_ok = 0
     lost_recovery_fail = 0
-    malformed_handled = 0
     malformed_crashed = 0
 
-    consecutive_lost = 0
-    last_was_lost = False
-
-    for i, (pkt_type, pkt_subtype, pkt_data) in enumerate(packets):
-        if pkt_type == PacketType.NORMAL:
-            if last_was_lost:
-                # Previous packets were lost, this is the recovery packet
-                if consecutive_lost <= r_value:
-                    # Should recover
-                    lost_recovery_ok += 1
-                    notes.append(f"Packet {i}: Recovery after {consecutive_lost} lost (R={r_value})")
-                else:
-                    # Beyond R, may not recover
-                    lost_recovery_fail += 1
-                    notes.append(f"Packet {i}: Recovery attempt after {consecutive_lost} lost (R={r_value})")
-                consecutive_lost = 0
-                last_was_lost = False
-
-            # Normal decompression
-            # In a real test, we'd call the decompressor here
-            # For now, we just count it as OK
-            normal_ok += 1
-
-        elif pkt_type == PacketType.LOST:
-            lost_handled += 1
-            consecutive_lost += 1
-            last_was_lost = True
-            # In a real test, we'd call notify_packet_loss() here
-
-        elif pkt_type == PacketType.MALFORMED:
-            # In a real test, we'd feed corrupted data and check for crashes
-            # For now, just count it as handled
-            malformed_handled += 1
-            if last_was_lost:
-                consecutive_lost = 0
-                last_was_lost = False
+    # Packets are only counted for now, so work on the type sequence as a
+    # byte string (one byte per packet) with C-level scans
+    # In a real test, we'd call the decompressor for NORMAL packets,
+    # notify_packet_loss() for LOST ones, and feed MALFORMED data to check
+    # for crashes
+    types = bytes(pkt_type for pkt_type, _, _ in packets)
+    normal_ok = types.count(_NORMAL)
+    lost_handled = types.count(_LOST)
+    malformed_handled = types.count(_MALFORMED)
+
+    # A NORMAL packet after a run of LOST packets is a recovery attempt
+    for run in _LOST_RUN.finditer(types):
+        i = run.end() - 1
+        if types[i] != _NORMAL:
+            continue
+        consecutive_lost = run.group().count(_LOST)
+        if consecutive_lost <= r_value:
+            # Should recover
+            lost_recovery_ok += 1
+            if len(notes) < MAX_NOTES:
+                notes.append(f"Packet {i}: Recovery after {consecutive_lost} lost (R={r_value})")
+        else:
+            # Beyond R, may not recover
+            lost_recovery_fail += 1
+            if len(notes) < MAX_NOTES:
+                notes.append(f"Packet {i}: Recovery attempt after {consecutive_lost} lost (R={r_value})")
 
     total = len(packets)
     overall_pass = (normal_fail == 0 and malformed_crashed == 0)
@@ -188,7 +199,7 @@ def validate_with_c_library(
         malformed_handled=malformed_handled,
         malformed_crashed=malformed_crashed,
         overall_pass=overall_pass,
-        notes=notes[:10]  # Limit notes
+        notes=notes
     )
 
 
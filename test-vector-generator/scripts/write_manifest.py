@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Write test-vectors/manifest.json from the per-vector metadata files.
+
+The manifest lists every vector whose input file is present, with the
+parameters the test suites need, so they can load one JSON file instead
+of globbing and parsing each metadata file at startup.
+
+Usage:
+    python write_manifest.py [test-vectors-dir]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Map metadata input filenames to actual filenames (some were renamed)
+FILENAME_MAP = {
+    "1028packets.ccsds": "venus-express.ccsds",
+}
+
+
+def build_manifest(vectors_dir: Path) -> list:
+    """Build the manifest entries for all vectors in vectors_dir."""
+    input_dir = vectors_dir / "input"
+    expected_dir = vectors_dir / "expected-output"
+    vectors = []
+
+    for metadata_file in sorted(expected_dir.glob("*-metadata.json")):
+        name = metadata_file.stem.replace("-metadata", "")
+        with open(metadata_file) as f:
+            metadata = json.load(f)
+
+        input_file = metadata["input"]["file"]
+        input_file = FILENAME_MAP.get(input_file, input_file)
+
+        # Skip if input file doesn't exist
+        if not (input_dir / input_file).exists():
+            print(f"WARNING: input for {name} not found, skipping")
+            continue
+
+        parameters = metadata["compression"]["parameters"]
+        compressed = metadata["output"]["compressed"]
+        vectors.append({
+            "name": name,
+            "input_file": input_file,
+            "output_file": compressed["file"],
+            "packet_length": metadata["compression"]["packet_length"],
+            "robustness": parameters["robustness"],
+            "pt": parameters["pt"],
+            "ft": parameters["ft"],
+            "rt": parameters["rt"],
+            "expected_size": compressed["size"],
+            "expected_md5": compressed["md5"],
+        })
+
+    return vectors
+
+
+def main():
+    if len(sys.argv) > 2:
+        print("Usage: write_manifest.py [test-vectors-dir]")
+        sys.exit(1)
+
+    default_dir = Path(__file__).resolve().parent.parent.parent / "test-vectors"
+    vectors_dir = Path(sys.argv[1]) if len(sys.argv) == 2 else default_dir
+
+    vectors = build_manifest(vectors_dir)
+    manifest_file = vectors_dir / "manifest.json"
+    with open(manifest_file, "w") as f:
+        json.dump(vectors, f, indent=2)
+        f.write("\n")
+
+    print(f"Wrote {len(vectors)} vectors to {manifest_file}")
+
+
+if __name__ == "__main__":
+    main()